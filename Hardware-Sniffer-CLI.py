@@ -18,6 +18,11 @@ def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("-e", "--export", action="store_true", help="export system report")
     parser.add_argument("-o", "--output-dir", default="SysReport", help="custom output directory to save system report, default to SysReport")
+    parser.add_argument("--lspci-names", action="store_true", help="name PCI devices exactly as lspci does (Linux only, runs lspci once)")
+    parser.add_argument("--sysfs-root", default=None, help="read /sys and /proc from a captured tree under this directory instead of the running system (Linux only)")
+    parser.add_argument("--profile", action="store_true", help="print how long each collection step took and how much it read")
+    parser.add_argument("--profile-report", action="store_true", help="also save the collection metrics in the report as \"Collection Metrics\"")
+    parser.add_argument("--cpuid-dump", action="store_true", help="save every standard and extended CPUID leaf in the report as \"CPUID\" (x86 only)")
     args = parser.parse_args()
 
     if not args.export:
@@ -29,7 +34,7 @@ def main():
         return EXIT_UNSUPPORTED_OS
 
     try:
-        h = HardwareSniffer.HardwareSniffer(args.output_dir, rich_format=False)
+        h = HardwareSniffer.HardwareSniffer(args.output_dir, rich_format=False, lspci_names=args.lspci_names, sysfs_root=args.sysfs_root, embed_metrics=args.profile_report, embed_cpuid=args.cpuid_dump)
 
         h.hardware_info.hardware_collector()
     except Exception as e:
@@ -54,6 +59,11 @@ def main():
     h.u.head("Hardware Sniffer")
     print("")
     print("Done! Please check the report in `{}`".format(h.result_dir))
+
+    if args.profile:
+        print("")
+        print("Collection metrics:")
+        print(h.hardware_info.metrics.format_table())
     return EXIT_SUCCESS
 
 if __name__ == '__main__':
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+from Scripts import cpuid
 from Scripts import github
 from Scripts import resource_fetcher
 from Scripts import run
@@ -15,20 +16,22 @@ import getpass
 os_name = platform.system()
 
 class HardwareSniffer:
-    def __init__(self, result_dir="SysReport", rich_format=True):
+    def __init__(self, result_dir="SysReport", rich_format=True, lspci_names=False, sysfs_root=None, embed_metrics=False, embed_cpuid=False):
         self.github = github.Github()
         self.fetcher = resource_fetcher.ResourceFetcher()
         self.run = run.Run().run
         self.u = utils.Utils(rich_format=rich_format)
         self.temporary_dir = tempfile.mkdtemp()
         self.result_dir = result_dir
+        self.embed_metrics = embed_metrics
+        self.embed_cpuid = embed_cpuid
 
         if os_name == "Windows":
             from Scripts.platforms.windows import WindowsHardwareInfo
             self.hardware_info = WindowsHardwareInfo(rich_format=rich_format)
         elif os_name == "Linux":
             from Scripts.platforms.linux import LinuxHardwareInfo
-            self.hardware_info = LinuxHardwareInfo(rich_format=rich_format)
+            self.hardware_info = LinuxHardwareInfo(rich_format=rich_format, lspci_names=lspci_names, sysfs_root=sysfs_root)
         else:
             raise NotImplementedError(f"Unsupported operating system: {os_name}")
 
@@ -141,7 +144,19 @@ class HardwareSniffer:
             
             self.report_path = os.path.join(self.result_dir, "Report.json")
 
-            self.u.write_file(self.report_path, self.hardware_info.result)
+            report = self.hardware_info.result
+
+            if self.embed_metrics:
+                report = dict(report)
+                report["Collection Metrics"] = self.hardware_info.metrics.get_statistics()
+
+            if self.embed_cpuid:
+                cpuid_dump = self.get_cpuid_dump()
+                if cpuid_dump:
+                    report = dict(report)
+                    report["CPUID"] = cpuid_dump
+
+            self.u.write_file(self.report_path, report)
             print("Report saved to `{}`".format(self.report_path))
         except Exception as e:
             print(f"Error exporting report: {e}", file=sys.stderr)
@@ -149,6 +164,13 @@ class HardwareSniffer:
 
         print("")
 
+    def get_cpuid_dump(self):
+        # Only x86 machines can run the stub, the report simply goes without the dump elsewhere
+        try:
+            return cpuid.get_cpuid().dump()
+        except Exception:
+            return None
+
     def get_latest_acpidump(self):
         return "https://github.com/acpica/acpica/releases/download/R2024_12_12/acpidump.exe"
 
@@ -219,30 +241,39 @@ class HardwareSniffer:
                 except Exception as e:
                     print(" - {} -> {} failed: {}".format(os.path.basename(path), os.path.basename(path)[:-4] + ".aml", e))
         elif os_name == "Linux":
-            table_dir = "/sys/firmware/acpi/tables"
+            table_dir = self.hardware_info.sysfs.get_host_path("/sys/firmware/acpi/tables")
             if not os.path.isdir(table_dir):
                 print("Could not locate {}!".format(table_dir))
                 return
             
-            tables = self.u.find_matching_paths(table_dir, type_filter="file")
+            tables = list(self.u.find_matching_paths(table_dir, type_filter="file"))
             if not tables:
                 print(" - No tables found!")
                 print("")
                 return
             
+            copy_jobs = []
             for table_path, type in tables:
                 destination_path = os.path.join(acpi_dir, table_path.upper() + ".aml")
                 self.u.create_folder(os.path.dirname(destination_path))
+                copy_jobs.append((os.path.join(table_dir, table_path), destination_path))
+
+            if os.geteuid() == 0 or all(os.access(source_path, os.R_OK) for source_path, destination_path in copy_jobs):
+                for source_path, destination_path in copy_jobs:
+                    try:
+                        shutil.copyfile(source_path, destination_path)
+                    except Exception as e:
+                        print(" - {}".format(e))
+                        return
+            else:
+                # One elevated shell copies every table, then hands the folder back to the user
+                copy_script = 'owner="$1"; folder="$2"; shift 2; while [ "$#" -gt 1 ]; do cp "$1" "$2" || exit 1; shift 2; done; chown -R "$owner" "$folder"'
+                args = ["sudo", "sh", "-c", copy_script, "sh", getpass.getuser(), acpi_dir]
+                for source_path, destination_path in copy_jobs:
+                    args.extend((source_path, destination_path))
 
                 out = self.run({
-                    "args": ["sudo", "cp", os.path.join(table_dir, table_path), destination_path]
-                })
-                if out[2] != 0:
-                    print(" - {}".format(out[1]))
-                    return
-                
-                out = self.run({
-                    "args": ["sudo", "chown", getpass.getuser(), destination_path]
+                    "args": args
                 })
                 if out[2] != 0:
                     print(" - {}".format(out[1]))
@@ -0,0 +1,18 @@
+def lookup_rows(keys, lookup, columns):
+    # Each distinct key is looked up once, "Indexes" maps every input back to its row
+    rows = {}
+    indexes = []
+
+    for key in keys:
+        indexes.append(rows.setdefault(key, len(rows)))
+
+    results = {column: [] for column in columns}
+
+    for key in rows:
+        row = lookup(key)
+
+        for column in columns:
+            results[column].append(row[column])
+
+    results["Indexes"] = indexes
+    return results
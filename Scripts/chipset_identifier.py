@@ -0,0 +1,32 @@
+from Scripts import batch_lookup
+from Scripts.datasets import chipset_data
+
+class ChipsetIdentifier:
+    def lookup_controller(self, device_id):
+        return chipset_data.chipset_controllers.get(device_id)
+
+    def lookup_system_chipset(self, system_name):
+        for chipset_name in chipset_data.amd_chipsets:
+            if chipset_name in system_name:
+                return chipset_name
+
+        return None
+
+    def lookup_chipset(self, device_ids, system_name):
+        # AMD boards name the chipset in the model, which wins over the controller IDs
+        system_chipset = self.lookup_system_chipset(system_name)
+        if system_chipset:
+            return system_chipset
+
+        for device_id in device_ids:
+            chipset_model = self.lookup_controller(device_id)
+            if chipset_model:
+                return chipset_model
+
+        return "Unknown"
+
+    def lookup_controllers(self, device_ids):
+        return batch_lookup.lookup_rows(device_ids, lambda device_id: {"Device ID": device_id, "Chipset": self.lookup_controller(device_id) or "Unknown"}, ("Device ID", "Chipset"))
+
+    def lookup_system_chipsets(self, system_names):
+        return batch_lookup.lookup_rows(system_names, lambda system_name: {"System Name": system_name, "Chipset": self.lookup_system_chipset(system_name) or "Unknown"}, ("System Name", "Chipset"))
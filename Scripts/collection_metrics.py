@@ -0,0 +1,100 @@
+import threading
+import time
+
+COUNTERS = ("Files Read", "Bytes Read", "Cache Hits", "Cache Misses", "Directories Listed", "Subprocesses")
+
+class CollectionMetrics:
+    def __init__(self):
+        # Each collection step runs on one thread, so whatever that thread records belongs to the step
+        self.current = threading.local()
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.steps = {}
+            self.total_time = 0.0
+
+    def get_step(self, name):
+        step = self.steps.get(name)
+
+        if step is None:
+            step = self.steps[name] = {"Wall Time": 0.0, "CPU Time": 0.0}
+            for counter in COUNTERS:
+                step[counter] = 0
+
+        return step
+
+    def record(self, counter, amount=1):
+        name = getattr(self.current, "step", None) or "other"
+
+        with self.lock:
+            self.get_step(name)[counter] += amount
+
+    def wrap(self, name, function):
+        def step():
+            previous_step = getattr(self.current, "step", None)
+            self.current.step = name
+            wall_start = time.perf_counter()
+            cpu_start = time.thread_time()
+
+            try:
+                return function()
+            finally:
+                wall_time = time.perf_counter() - wall_start
+                cpu_time = time.thread_time() - cpu_start
+                self.current.step = previous_step
+
+                with self.lock:
+                    step = self.get_step(name)
+                    step["Wall Time"] += wall_time
+                    step["CPU Time"] += cpu_time
+
+        step.__name__ = getattr(function, "__name__", name)
+        return step
+
+    def run_steps(self, scheduler, steps, on_start=None, on_finish=None):
+        # Dependencies name the original functions, map them onto the timed ones
+        timed_functions = {function: self.wrap(function.__name__, function) for function, dependencies in steps}
+
+        with self.lock:
+            for function, dependencies in steps:
+                self.get_step(function.__name__)
+
+        start_time = time.perf_counter()
+        try:
+            return scheduler.run([(timed_functions[function], [timed_functions.get(dependency, dependency) for dependency in dependencies or ()]) for function, dependencies in steps], on_start, on_finish)
+        finally:
+            self.total_time = time.perf_counter() - start_time
+
+    def get_statistics(self):
+        with self.lock:
+            statistics = {}
+
+            for name, step in self.steps.items():
+                statistics[name] = {
+                    "Wall Time (ms)": round(step["Wall Time"] * 1000, 2),
+                    "CPU Time (ms)": round(step["CPU Time"] * 1000, 2)
+                }
+                for counter in COUNTERS:
+                    statistics[name][counter] = step[counter]
+
+            total = {
+                "Wall Time (ms)": round(self.total_time * 1000, 2),
+                "CPU Time (ms)": round(sum(step["CPU Time"] for step in self.steps.values()) * 1000, 2)
+            }
+            for counter in COUNTERS:
+                total[counter] = sum(step[counter] for step in self.steps.values())
+            statistics["Total"] = total
+
+            return statistics
+
+    def format_table(self):
+        statistics = self.get_statistics()
+        columns = ("Wall Time (ms)", "CPU Time (ms)") + COUNTERS
+
+        lines = ["{:<22}".format("Step") + "".join(column.rjust(len(column) + 2) for column in columns)]
+        for name, values in statistics.items():
+            lines.append("{:<22}".format(name) + "".join(str(values[column]).rjust(len(column) + 2) for column in columns))
+
+        return "\n".join(lines)
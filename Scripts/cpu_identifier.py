@@ -1,19 +1,62 @@
+from Scripts import batch_lookup
 from Scripts.datasets import cpu_data
+import re
+
+IDENTIFIER_PATTERN = re.compile(r"Family (\d+) Model (\d+) Stepping (\d+)")
 
 class CPUIdentifier:
+    def __init__(self):
+        self.index = self.build_index(cpu_data.identifier)
+
+    def parse_identifier(self, cpu_identifier):
+        match = IDENTIFIER_PATTERN.search(cpu_identifier or "")
+
+        if not match:
+            return None
+
+        return tuple(int(value) for value in match.groups())
+
+    def build_index(self, entries):
+        # Later entries take precedence, an entry without a name hint shadows everything defined before it
+        index = {}
+
+        for entry in entries:
+            codename, identifier = entry[:2]
+            name_hint = entry[-1] if len(entry) > 2 else None
+            key = self.parse_identifier(identifier)
+
+            if key is None:
+                continue
+
+            candidates = index.get(key, [])
+            index[key] = [(name_hint, codename)] + (candidates if name_hint else [])
+
+        return index
+
     def lookup_codename(self, processor_name, cpu_identifier):
-        if cpu_identifier in "Family 6 Model 142 Stepping 10":
+        key = self.parse_identifier(cpu_identifier)
+
+        if key == (6, 142, 10):
             if ("0U" in processor_name or "7U" in processor_name) and "82" not in processor_name:
                 return "Kaby Lake-R"
-        
-        for entry in cpu_data.identifier[::-1]:
-            codename, identifier = entry[:2]
-            name_hint = entry[-1] if len(entry) > 2 else None
-            if identifier in cpu_identifier:
-                if name_hint:
-                    if name_hint in processor_name:
-                        return codename
-                else:
-                    return codename
-
-        return "Unknown"
\ No newline at end of file
+
+        for name_hint, codename in self.index.get(key, ()):
+            if not name_hint or name_hint in processor_name:
+                return codename
+
+        return "Unknown"
+
+    def lookup_codenames(self, processor_names, cpu_identifiers):
+        if len(processor_names) != len(cpu_identifiers):
+            raise ValueError("processor_names and cpu_identifiers differ in length ({} != {})".format(len(processor_names), len(cpu_identifiers)))
+
+        return batch_lookup.lookup_rows(zip(processor_names, cpu_identifiers), self.lookup_codename_row, ("Processor Name", "CPU Identifier", "Codename"))
+
+    def lookup_codename_row(self, key):
+        processor_name, cpu_identifier = key
+
+        return {
+            "Processor Name": processor_name,
+            "CPU Identifier": cpu_identifier,
+            "Codename": self.lookup_codename(processor_name, cpu_identifier)
+        }
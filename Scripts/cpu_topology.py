@@ -0,0 +1,183 @@
+from Scripts import sysfs
+import os
+
+CPU_PATH = "/sys/devices/system/cpu"
+NODE_PATH = "/sys/devices/system/node"
+
+class CPUTopology:
+    def __init__(self, sysfs_snapshot=None):
+        self.sysfs = sysfs_snapshot or sysfs.SysfsSnapshot()
+        self.reset()
+
+    def reset(self):
+        self.topology = None
+        self.cpu_path = None
+
+    def get_topology(self):
+        if self.topology is None:
+            self.topology = self.build() or {}
+
+        return self.topology
+
+    def read_cpu_attribute(self, cpu, name):
+        # cpuN and its topology folder are never links, so only the CPU folder itself is resolved
+        value = self.sysfs.read_attribute("{}/cpu{}/{}".format(self.cpu_path, cpu, name))
+
+        if value is None:
+            return None
+
+        return value.decode("utf-8", errors="replace").strip() or None
+
+    def read_cpu_int(self, cpu, name):
+        try:
+            return int(self.read_cpu_attribute(cpu, name))
+        except (TypeError, ValueError):
+            return None
+
+    def read_shared_cpus(self, cpu, *names):
+        # Newer kernels renamed some of the sibling lists, try them in order
+        for name in names:
+            cpus = sysfs.parse_cpu_list(self.read_cpu_attribute(cpu, "topology/" + name))
+            if cpus:
+                return cpus
+
+        return [cpu]
+
+    def build(self):
+        cpus = self.sysfs.read_cpu_list(os.path.join(CPU_PATH, "online")) or self.sysfs.read_cpu_list(os.path.join(CPU_PATH, "present"))
+
+        if not cpus:
+            return None
+
+        self.cpu_path = self.sysfs.realpath(CPU_PATH)
+        online_cpus = set(cpus)
+        package_list = []
+        packages = {}
+        dies = {}
+        core_of = {}
+        cores = []
+
+        # One read per package, die and core instead of several per logical CPU
+        for cpu in cpus:
+            if cpu not in packages:
+                package_id = self.read_cpu_int(cpu, "topology/physical_package_id")
+
+                # Containers often hide the topology folder, counting every CPU as a package would be made up
+                if package_id is None:
+                    return None
+
+                package = {"ID": package_id if package_id >= 0 else len(package_list), "Dies": []}
+                package_list.append(package)
+
+                for sibling in self.read_shared_cpus(cpu, "package_cpus_list", "core_siblings_list"):
+                    if sibling in online_cpus:
+                        packages.setdefault(sibling, package)
+                packages[cpu] = package
+
+            if cpu not in dies:
+                die_id = self.read_cpu_int(cpu, "topology/die_id")
+                die = {"ID": die_id if die_id is not None and die_id >= 0 else 0, "Cores": []}
+                packages[cpu]["Dies"].append(die)
+
+                for sibling in self.read_shared_cpus(cpu, "die_cpus_list", "package_cpus_list", "core_siblings_list"):
+                    if sibling in online_cpus:
+                        dies.setdefault(sibling, die)
+                dies[cpu] = die
+
+            if cpu not in core_of:
+                core = {"Threads": [], "Type": None}
+                dies[cpu]["Cores"].append(core)
+                cores.append(core)
+
+                for sibling in self.read_shared_cpus(cpu, "core_cpus_list", "thread_siblings_list"):
+                    if sibling in online_cpus and sibling not in core_of:
+                        core_of[sibling] = core
+                        core["Threads"].append(sibling)
+
+                if cpu not in core_of:
+                    core_of[cpu] = core
+                    core["Threads"].append(cpu)
+
+        self.classify_cores(cores)
+
+        smt_active = self.sysfs.read_int(os.path.join(CPU_PATH, "smt", "active"))
+        if smt_active is None:
+            smt_active = int(any(len(core["Threads"]) > 1 for core in cores))
+
+        return {
+            "Packages": sorted(package_list, key=lambda package: package["ID"]),
+            "Cores": cores,
+            "Threads": len(cpus),
+            "SMT": "Enabled" if smt_active else "Disabled",
+            "NUMA Nodes": self.read_numa_nodes()
+        }
+
+    def classify_cores(self, cores):
+        # Hybrid Intel parts expose one PMU per core type
+        performance_cpus = self.sysfs.read_cpu_list("/sys/devices/cpu_core/cpus")
+        efficiency_cpus = self.sysfs.read_cpu_list("/sys/devices/cpu_atom/cpus")
+
+        if performance_cpus and efficiency_cpus:
+            performance_cpus = set(performance_cpus)
+
+            for core in cores:
+                core["Type"] = "Performance" if core["Threads"][0] in performance_cpus else "Efficiency"
+            return
+
+        # x86 registers a single "cpu" PMU when every core is the same kind
+        if self.sysfs.isdir("/sys/devices/cpu"):
+            return
+
+        # Elsewhere big and little cores only differ in capacity or maximum frequency
+        for name in ("cpu_capacity", "cpufreq/cpuinfo_max_freq"):
+            capacities = [self.read_cpu_int(core["Threads"][0], name) for core in cores[:1]]
+
+            if capacities[0] is None:
+                continue
+
+            capacities += [self.read_cpu_int(core["Threads"][0], name) for core in cores[1:]]
+
+            if None in capacities or len(set(capacities)) < 2:
+                return
+
+            highest_capacity = max(capacities)
+            for core, capacity in zip(cores, capacities):
+                core["Type"] = "Performance" if capacity == highest_capacity else "Efficiency"
+            return
+
+    def read_numa_nodes(self):
+        numa_nodes = {}
+
+        if not self.sysfs.isdir(NODE_PATH):
+            return numa_nodes
+
+        for node in self.sysfs.listdir(NODE_PATH):
+            if not node.startswith("node") or not node[4:].isdigit():
+                continue
+
+            cpus = self.sysfs.read_cpu_list(os.path.join(NODE_PATH, node, "cpulist"))
+            if cpus:
+                numa_nodes[int(node[4:])] = cpus
+
+        return dict(sorted(numa_nodes.items()))
+
+    def get_summary(self):
+        topology = self.get_topology()
+
+        if not topology:
+            return {}
+
+        summary = {
+            "Packages": len(topology["Packages"]),
+            "Dies": sum(len(package["Dies"]) for package in topology["Packages"]),
+            "Cores": len(topology["Cores"]),
+            "Threads": topology["Threads"],
+            "SMT": topology["SMT"],
+            "NUMA Nodes": len(topology["NUMA Nodes"]) or 1
+        }
+
+        if any(core["Type"] for core in topology["Cores"]):
+            summary["Performance Cores"] = sum(1 for core in topology["Cores"] if core["Type"] == "Performance")
+            summary["Efficiency Cores"] = sum(1 for core in topology["Cores"] if core["Type"] == "Efficiency")
+
+        return summary
@@ -9,6 +9,7 @@ from __future__ import print_function
 
 import platform
 import os
+import threading
 import ctypes
 from ctypes import c_uint32, c_long, c_ulong, c_size_t, c_void_p, POINTER, CFUNCTYPE
 
@@ -158,17 +159,77 @@ class CPUID(object):
 
 
 
-if __name__ == "__main__":
-    def valid_inputs():
-        cpuid = CPUID()
-        for eax in (0x0, 0x80000000):
-            highest, _, _, _ = cpuid(eax)
-            while eax <= highest:
-                regs = cpuid(eax)
-                yield (eax, regs)
-                eax += 1
+# Leaves whose subleaves enumerate something; the rest only answer subleaf 0
+_MAX_SUBLEAVES = 64
+
+def _subleaves_for(cpuid, leaf):
+    if leaf in (0x4, 0x8000001D):
+        # Cache descriptors, until the cache type reads as null
+        subleaf = 0
+        while subleaf < _MAX_SUBLEAVES and cpuid(leaf, subleaf)[0] & 0x1F:
+            subleaf += 1
+        return range(max(subleaf, 1))
+    if leaf in (0x7, 0x14, 0x17, 0x18):
+        # Subleaf 0 reports the highest valid subleaf in eax
+        return range(min(cpuid(leaf, 0)[0], _MAX_SUBLEAVES - 1) + 1)
+    if leaf in (0xB, 0x1F):
+        # Topology levels, until the level type reads as invalid
+        subleaf = 0
+        while subleaf < _MAX_SUBLEAVES and (cpuid(leaf, subleaf)[2] >> 8) & 0xFF:
+            subleaf += 1
+        return range(max(subleaf, 1))
+    if leaf == 0xD:
+        # XSAVE components that are supported in XCR0 or IA32_XSS
+        components = cpuid(leaf, 0)[0] | cpuid(leaf, 1)[2]
+        return [0, 1] + [bit for bit in range(2, 32) if components & (1 << bit)]
+    return [0]
+
+
+class CachedCPUID(object):
+    """Runs each (leaf, subleaf) once per process and answers repeats from memory."""
+
+    def __init__(self, cpuid=None):
+        self.cpuid = cpuid or CPUID()
+        self.results = {}
+        self.lock = threading.Lock()
+
+    def __call__(self, eax, ecx=0):
+        with self.lock:
+            regs = self.results.get((eax, ecx))
+            if regs is None:
+                regs = self.results[(eax, ecx)] = self.cpuid(eax, ecx)
+            return regs
+
+    def dump(self, max_leaves=0x100):
+        """Returns every standard and extended leaf as {"LLLLLLLL:S": [eax, ebx, ecx, edx]} in hex."""
+        leaves = {}
+
+        for base in (0x0, 0x80000000):
+            highest = self(base)[0]
+            if highest < base:
+                continue
+
+            for leaf in range(base, min(highest, base + max_leaves - 1) + 1):
+                for subleaf in _subleaves_for(self, leaf):
+                    leaves["{:08X}:{:X}".format(leaf, subleaf)] = ["{:08X}".format(reg) for reg in self(leaf, subleaf)]
 
+        return leaves
 
+
+_shared_cpuid = None
+_shared_cpuid_lock = threading.Lock()
+
+def get_cpuid():
+    """Returns the process-wide CachedCPUID, mapping the code stub on first use."""
+    global _shared_cpuid
+
+    with _shared_cpuid_lock:
+        if _shared_cpuid is None:
+            _shared_cpuid = CachedCPUID()
+        return _shared_cpuid
+
+
+if __name__ == "__main__":
     print(" ".join(x.ljust(8) for x in ("CPUID", "A", "B", "C", "D")).strip())
-    for eax, regs in valid_inputs():
-        print("%08x" % eax, " ".join("%08x" % reg for reg in regs))
\ No newline at end of file
+    for leaf, regs in get_cpuid().dump().items():
+        print(leaf.lower(), " ".join(reg.lower() for reg in regs))
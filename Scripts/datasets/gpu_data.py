@@ -0,0 +1,113 @@
+intel = [
+    ("Iron Lake", ("0042", "0046")),
+    ("Sandy Bridge", ("01",)),
+    ("Ivy Bridge", ("015", "016")),
+    ("Haswell", ("04", "0A", "0C", "0D")),
+    ("Broadwell", ("0B", "16")),
+    ("Skylake", ("09", "19")),
+    ("Apollo Lake", ("0A84", "1A", "5A")),
+    ("Gemini Lake", ("31",)),
+    ("Kaby Lake", ("59", "87C0")),
+    ("Coffee Lake", ("3E", "87", "9B")),
+    ("Ice Lake", ("8A",)),
+    ("Jasper Lake", ("4E",)),
+    ("Tiger Lake", ("9A",)),
+    ("Elkhart Lake", ("45",)),
+    ("Rocket Lake", ("4C",)),
+    ("Alder Lake-P", ("462", "46A")),
+    ("Alder Lake-N", ("46D",)),
+    ("Alder Lake-S", ("468", "469")),
+    ("DG1", ("49",), "Discrete GPU"),
+    ("Raptor Lake-S", ("A78",)),
+    ("Raptor Lake-P", ("A7",)),
+    ("Alchemist", ("56",), "Discrete GPU"),
+    ("Ponte Vecchio", ("0B69", "0B6E", "0BD"), "Discrete GPU"),
+    ("Meteor Lake", ("7D",))
+]
+
+amd = [
+    ("Picasso", ("15D8",), "Integrated GPU"),
+    ("Raven Ridge", ("15DD",), "Integrated GPU"),
+    ("Barcelo", ("15E7",), "Integrated GPU"),
+    ("Renoir", ("1636",), "Integrated GPU"),
+    ("Cezanne", ("1638",), "Integrated GPU"),
+    ("Lucienne", ("164C",), "Integrated GPU"),
+    ("Raphael", ("164E",), "Integrated GPU"),
+    ("Rembrandt", ("1681",), "Integrated GPU"),
+    ("Phoenix", ("15BF", "15C8", "1900"), "Integrated GPU"),
+    ("Mendocino", ("1506",), "Integrated GPU"),
+    ("Granite Ridge", ("13C0",), "Integrated GPU"),
+    ("RV610", ("94C",)),
+    ("RV630", ("958",)),
+    ("R600", ("940",)),
+    ("RV620", ("95C",)),
+    ("RV635", ("959",)),
+    ("R680", ("950F",)),
+    ("RV670", ("950", "951")),
+    ("RV711", ("9555", "9557")),
+    ("RV710", ("954", "955")),
+    ("RV730", ("948", "949")),
+    ("R700", ("9441", "9443")),
+    ("RV770", ("944", "945", "946A")),
+    ("RV790", ("946",)),
+    ("Redwood", ("68C", "68D")),
+    ("Juniper", ("68A", "68B")),
+    ("Lexington", ("6880",)),
+    ("Hemlock", ("689C", "689D")),
+    ("Cypress", ("688", "689")),
+    ("Onega", ("6750",)),
+    ("Turks", ("674", "675")),
+    ("Barts", ("673",)),
+    ("Antilles", ("671C", "671D")),
+    ("Cayman", ("670", "671")),
+    ("Cedar", ("68E8", "68E9", "68F")),
+    ("Cape Verde", ("6828", "6829", "682B", "683")),
+    ("Venus", ("682",)),
+    ("Malta", ("679B",)),
+    ("Tahiti", ("678", "679")),
+    ("Caicos", ("677",)),
+    ("Vesuvius", ("67B9",)),
+    ("Hawaii", ("67A", "67B")),
+    ("Saturn", ("6640", "6641", "6647")),
+    ("Bonaire", ("664", "665")),
+    ("Curacao", ("6810", "6811")),
+    ("Pitcairn", ("680", "681")),
+    ("Tonga", ("6929", "692B", "692F", "693")),
+    ("Grenada", ("67B0",)),
+    ("Meso", ("6907",)),
+    ("Topaz", ("690",)),
+    ("Fiji", ("730",)),
+    ("Oland", ("6608", "6609", "661", "6631")),
+    ("Ellesmere", ("67C", "67D")),
+    ("Baffin", ("67E", "67F")),
+    ("Lexa", ("698", "699")),
+    ("Polaris 20", ("6FDF",)),
+    ("Polaris 22", ("694",)),
+    ("Vega 10", ("686", "687")),
+    ("Vega 12", ("69A",)),
+    ("Vega 20", ("66A",)),
+    ("Navi 10", ("731",)),
+    ("Navi 12", ("736",)),
+    ("Navi 14", ("734",)),
+    ("Navi 21", ("73A", "73B")),
+    ("Navi 22", ("73C", "73D")),
+    ("Navi 23", ("73E", "73FF")),
+    ("Navi 24", ("742", "743")),
+    ("Navi 31", ("744", "745")),
+    ("Navi 32", ("746", "747")),
+    ("Navi 33", ("748", "749", "73F0"))
+]
+
+nvidia = [
+    ("Kepler", ("0FC", "0FD", "0FE", "0FF", "100", "101", "102", "103", "11", "128", "129", "12A", "12B", "130")),
+    ("Tesla", ("05E", "05F", "0A2", "0A3", "0A6", "0A7", "0C", "10C", "10D")),
+    ("Fermi", ("06C", "06D", "0DC", "0DD", "0DE", "0DF", "0E2", "0E3", "0F0", "104", "105", "107", "108", "109", "1140", "120", "121", "124", "125")),
+    ("Maxwell", ("13", "14", "16", "17")),
+    ("Pascal", ("15", "172", "1B", "1C", "1D0", "1D1", "1D3", "1D5"))
+]
+
+vendors = {
+    "8086": ("Intel", intel, "Integrated GPU", "Unknown"),
+    "1002": ("AMD", amd, "Discrete GPU", "Unknown"),
+    "10DE": ("NVIDIA", nvidia, "Discrete GPU", "Discrete GPU")
+}
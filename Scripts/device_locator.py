@@ -1,6 +1,9 @@
-from Scripts import utils
+from Scripts import sysfs
 import os
 import re
+import threading
+
+PCI_FUNCTION_PATTERN = re.compile(r"^[0-9a-fA-F]+:[0-9a-fA-F]+:([0-9a-fA-F]+)\.([0-9a-fA-F]+)$")
 
 class WindowsDeviceLocator:
     def __init__(self):
@@ -72,56 +75,128 @@ class WindowsDeviceLocator:
                 "ACPI Path": acpi_path
             }
         
-class LinuxDeviceLocator:
-    def __init__(self):
-        self.utils = utils.Utils()
+class PciTopology:
+    def __init__(self, sysfs_snapshot, devices_path="/sys/devices"):
+        self.sysfs = sysfs_snapshot
+        self.devices_path = devices_path
+        self.lock = threading.Lock()
+        self.reset()
 
-    def get_device_location_paths(self, device_dir):
-        device_location_paths = {}
+    def reset(self):
+        self.pci_paths = None
+        self.fallback_paths = {}
 
-        uevent = self.utils.read_file(os.path.join(device_dir, "uevent")) or "\n"
-        device_slot_name = None
+    def parse_root_domain(self, name):
+        try:
+            return int(name[3:].split(":")[0], 16)
+        except ValueError:
+            return None
 
-        for line in uevent.split("\n"):
-            lower_line = line.lower()
+    def build(self):
+        pci_paths = {}
 
-            if "pci_slot_name" in lower_line:
-                device_slot_name = line.split("=")[1]
-                break
+        try:
+            roots = sorted(name for name in self.sysfs.listdir(self.devices_path) if name.startswith("pci") and ":" in name)
+        except OSError:
+            roots = []
 
-        pci_path = None
+        # Each entry carries the domain and the Pci() chain of its parent bridge
+        pending = [(self.sysfs.get_host_path(os.path.join(self.devices_path, name)), self.parse_root_domain(name), "") for name in roots]
 
-        if device_slot_name:
-            device_path = os.path.join("/sys/bus/pci/devices", device_slot_name)
+        while pending:
+            bus_dir, domain, parent_segments = pending.pop()
 
-            if os.path.exists(device_path):
-                real_path = os.path.realpath(device_path)
-                
-                pci_segments = []
-                path_parts = real_path.split("/")
-                
-                domain = None
-                for part in path_parts:
-                    if part.startswith("pci") and ":" in part:
-                        domain = int(part[3:].split(":")[0], 16)
-                    elif ":" in part and "." in part:
-                        segments = part.replace(":", ".").split(".")
-                        if len(segments) >= 4:
-                            device = int(segments[2], 16)
-                            function = int(segments[3], 16)
-                            pci_segments.append("Pci(0x{:x},0x{:x})".format(device, function))
-                
-                if domain is not None and pci_segments:
-                    pci_path = "PciRoot(0x{:x})/{}".format(domain, "/".join(pci_segments))
+            try:
+                with os.scandir(bus_dir) as iterator:
+                    entries = [entry for entry in iterator if entry.is_dir(follow_symlinks=False)]
+            except OSError:
+                continue
+
+            for entry in entries:
+                if entry.name.startswith("pci") and ":" in entry.name:
+                    pending.append((entry.path, self.parse_root_domain(entry.name), parent_segments))
+                    continue
+
+                match = PCI_FUNCTION_PATTERN.match(entry.name)
+                if not match:
+                    continue
+
+                segments = "{}/Pci(0x{:x},0x{:x})".format(parent_segments, int(match.group(1), 16), int(match.group(2), 16))
+
+                if domain is not None:
+                    pci_paths[entry.name] = "PciRoot(0x{:x}){}".format(domain, segments)
+
+                pending.append((entry.path, domain, segments))
+
+        return pci_paths
+
+    def resolve_pci_path(self, device_slot_name):
+        device_path = os.path.join("/sys/bus/pci/devices", device_slot_name)
+
+        if not self.sysfs.exists(device_path):
+            return None
+
+        pci_segments = []
+        domain = None
+
+        for part in self.sysfs.realpath(device_path).split("/"):
+            if part.startswith("pci") and ":" in part:
+                domain = self.parse_root_domain(part)
+            elif ":" in part and "." in part:
+                segments = part.replace(":", ".").split(".")
+                if len(segments) >= 4:
+                    pci_segments.append("Pci(0x{:x},0x{:x})".format(int(segments[2], 16), int(segments[3], 16)))
+
+        if domain is None or not pci_segments:
+            return None
+
+        return "PciRoot(0x{:x})/{}".format(domain, "/".join(pci_segments))
+
+    def get_pci_path(self, device_slot_name):
+        with self.lock:
+            if self.pci_paths is None:
+                self.pci_paths = self.build()
+
+            if device_slot_name in self.pci_paths:
+                return self.pci_paths[device_slot_name]
+
+            # Hosts that hang PCI roots off other buses (e.g. Hyper-V) are not under /sys/devices/pci*
+            if device_slot_name not in self.fallback_paths:
+                self.fallback_paths[device_slot_name] = self.resolve_pci_path(device_slot_name)
+
+            return self.fallback_paths[device_slot_name]
+
+class LinuxDeviceLocator:
+    def __init__(self, sysfs_snapshot=None):
+        self.sysfs = sysfs_snapshot or sysfs.SysfsSnapshot()
+        self.topology = PciTopology(self.sysfs)
+        self.location_paths = {}
+
+    def reset(self):
+        self.topology.reset()
+        self.location_paths = {}
+
+    def get_device_location_paths(self, device_dir):
+        real_device_dir = self.sysfs.realpath(device_dir)
+
+        if real_device_dir in self.location_paths:
+            return dict(self.location_paths[real_device_dir])
+
+        device_location_paths = {}
+
+        device_slot_name = self.sysfs.read_uevent(device_dir).get("PCI_SLOT_NAME")
+
+        pci_path = self.topology.get_pci_path(device_slot_name) if device_slot_name else None
 
         if pci_path:
             device_location_paths["PCI Path"] = pci_path
 
-        acpi_path = self.utils.read_file(os.path.join(device_dir, "firmware_node", "path"))
+        acpi_path = self.sysfs.read_text(os.path.join(device_dir, "firmware_node", "path"))
         if acpi_path:
             acpi_path = acpi_path.strip()
             if acpi_path.startswith("\\_SB_."):
                 acpi_path = "\\_SB." + acpi_path[6:]
             device_location_paths["ACPI Path"] = acpi_path
 
-        return device_location_paths
\ No newline at end of file
+        self.location_paths[real_device_dir] = device_location_paths
+        return dict(device_location_paths)
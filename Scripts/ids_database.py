@@ -0,0 +1,380 @@
+from collections.abc import Mapping
+import hashlib
+import mmap
+import os
+import re
+import struct
+import sys
+import tempfile
+import threading
+
+INDEX_MAGIC = b"HSIDSIDX"
+INDEX_VERSION = 2
+INDEX_EXTENSION = ".idx"
+
+# magic, version, source sha1, source size, source mtime (ns), record count
+INDEX_HEADER = struct.Struct("<8sI20sQQI")
+# kind, up to four 16-bit IDs, string offset, string length
+INDEX_RECORD = struct.Struct(">B4HIH")
+INDEX_KEY_SIZE = 9
+
+KIND_VENDOR = 0
+KIND_DEVICE = 1
+KIND_CLASS = 2
+KIND_SUBCLASS = 3
+KIND_PROG_IF = 4
+KIND_SUBSYSTEM = 5
+
+# Matches the newline in front of every top-level line, capturing vendor or class IDs
+TOP_LEVEL_LINE_PATTERN = re.compile(rb"\n(?:([0-9A-Fa-f]{4})\s|C ([0-9A-Fa-f]{2})\s|[^\t#\r\n])")
+
+databases = {}
+databases_lock = threading.Lock()
+
+def load(source_path):
+    source_path = os.path.abspath(source_path)
+
+    with databases_lock:
+        if source_path not in databases:
+            try:
+                databases[source_path] = IdsIndex(source_path)
+            except OSError:
+                databases[source_path] = LazyIdsDatabase(source_path)
+
+        return databases[source_path]
+
+class LazyIdsDatabase(Mapping):
+    def __init__(self, source_path):
+        self.source_path = source_path
+        self.vendor_blocks = {}
+        self.class_blocks = {}
+        self.vendors = {}
+        self.classes = {}
+
+        with open(source_path, "rb") as source_file:
+            try:
+                self.buffer = mmap.mmap(source_file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                self.buffer = b""
+
+        block_starts = []
+
+        for match in TOP_LEVEL_LINE_PATTERN.finditer(self.buffer):
+            if match.lastindex == 1:
+                block_starts.append((self.vendor_blocks, match.group(1).decode().upper(), match.start() + 1))
+            elif match.lastindex == 2:
+                block_starts.append((self.class_blocks, match.group(2).decode().upper(), match.start() + 1))
+            else:
+                block_starts.append((None, None, match.start() + 1))
+
+        for index, (blocks, block_id, block_start) in enumerate(block_starts):
+            if blocks is None or block_id in blocks:
+                continue
+
+            block_end = block_starts[index + 1][2] if index + 1 < len(block_starts) else len(self.buffer)
+            blocks[block_id] = (block_start, block_end)
+
+    def read_block(self, blocks, block_id):
+        block_start, block_end = blocks[block_id]
+        lines = self.buffer[block_start:block_end].decode("utf-8", errors="replace").splitlines()
+
+        return lines[0].split(maxsplit=1 if blocks is self.vendor_blocks else 2)[-1], lines[1:]
+
+    def get_vendor(self, vendor_id):
+        vendor_id = (vendor_id or "").upper()
+
+        if vendor_id in self.vendors:
+            return self.vendors[vendor_id]
+
+        if vendor_id not in self.vendor_blocks:
+            return None
+
+        vendor_name, lines = self.read_block(self.vendor_blocks, vendor_id)
+        vendor = {"name": vendor_name, "devices": {}, "subsystems": {}}
+        current_device = None
+
+        for line in lines:
+            if not line.strip() or line.startswith("#"):
+                continue
+
+            if line.startswith("\t\t"):
+                parts = line.strip().split(maxsplit=2)
+                if current_device and len(parts) == 3:
+                    vendor["subsystems"][current_device].setdefault("{} {}".format(parts[0], parts[1]).upper(), parts[2])
+                continue
+
+            parts = line.strip().split(maxsplit=1)
+            if len(parts) == 2:
+                current_device = parts[0].upper()
+                vendor["devices"].setdefault(current_device, parts[1])
+                vendor["subsystems"].setdefault(current_device, {})
+
+        self.vendors[vendor_id] = vendor
+        return vendor
+
+    def get_class(self, class_id):
+        class_id = (class_id or "").upper()
+
+        if class_id in self.classes:
+            return self.classes[class_id]
+
+        if class_id not in self.class_blocks:
+            return None
+
+        class_name, lines = self.read_block(self.class_blocks, class_id)
+        device_class = {"name": class_name, "subclasses": {}}
+        current_subclass = None
+
+        for line in lines:
+            if not line.strip() or line.startswith("#"):
+                continue
+
+            parts = line.strip().split(maxsplit=1)
+            if len(parts) != 2:
+                continue
+
+            if not line.startswith("\t\t"):
+                current_subclass = device_class["subclasses"].setdefault(parts[0].upper(), {"name": parts[1], "prog_ifs": {}})
+            elif current_subclass:
+                current_subclass["prog_ifs"].setdefault(parts[0].upper(), parts[1])
+
+        self.classes[class_id] = device_class
+        return device_class
+
+    def __getitem__(self, vendor_id):
+        vendor = self.get_vendor(vendor_id)
+
+        if vendor is None:
+            raise KeyError(vendor_id)
+
+        return vendor
+
+    def __iter__(self):
+        return iter(self.vendor_blocks)
+
+    def __len__(self):
+        return len(self.vendor_blocks)
+
+    def get_vendor_name(self, vendor_id):
+        return (self.get_vendor(vendor_id) or {}).get("name")
+
+    def get_device_name(self, vendor_id, device_id):
+        return (self.get_vendor(vendor_id) or {}).get("devices", {}).get((device_id or "").upper())
+
+    def get_subsystem_name(self, vendor_id, device_id, subsystem_vendor_id, subsystem_device_id):
+        subsystems = (self.get_vendor(vendor_id) or {}).get("subsystems", {}).get((device_id or "").upper(), {})
+        return subsystems.get("{} {}".format(subsystem_vendor_id, subsystem_device_id).upper())
+
+    def get_class_name(self, class_id):
+        return (self.get_class(class_id) or {}).get("name")
+
+    def get_subclass_name(self, class_id, subclass_id):
+        return ((self.get_class(class_id) or {}).get("subclasses", {}).get((subclass_id or "").upper()) or {}).get("name")
+
+    def get_prog_if_name(self, class_id, subclass_id, prog_if):
+        return ((self.get_class(class_id) or {}).get("subclasses", {}).get((subclass_id or "").upper()) or {}).get("prog_ifs", {}).get((prog_if or "").upper())
+
+class IdsIndex:
+    def __init__(self, source_path):
+        self.source_path = source_path
+        self.buffer = None
+        self.record_count = 0
+        self.strings_offset = 0
+        self.names = {}
+
+        source_stat = os.stat(source_path)
+
+        for index_path in self.get_index_paths():
+            if self.open(index_path, source_stat):
+                return
+
+        for index_path in self.get_index_paths():
+            try:
+                self.compile(index_path)
+            except OSError:
+                continue
+
+            if self.open(index_path, os.stat(source_path)):
+                return
+
+        raise OSError("Could not open or compile an index for {}".format(source_path))
+
+    def get_index_paths(self):
+        index_name = os.path.basename(self.source_path) + INDEX_EXTENSION
+        index_paths = []
+
+        if not getattr(sys, "frozen", False):
+            index_paths.append(self.source_path + INDEX_EXTENSION)
+
+        if os.name == "nt":
+            cache_dir = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+        else:
+            cache_dir = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+
+        index_paths.append(os.path.join(cache_dir, "Hardware-Sniffer", index_name))
+
+        return index_paths
+
+    def get_source_digest(self):
+        with open(self.source_path, "rb") as source_file:
+            return hashlib.sha1(source_file.read()).digest()
+
+    def parse_entries(self):
+        entries = {}
+        current_vendor = current_device = current_class = current_subclass = None
+
+        with open(self.source_path, "rb") as source_file:
+            lines = source_file.read().decode("utf-8", errors="replace").splitlines()
+
+        for line in lines:
+            if not line.strip() or line.startswith("#"):
+                continue
+
+            try:
+                if not line.startswith("\t"):
+                    current_vendor = current_device = current_class = current_subclass = None
+                    parts = line.split(maxsplit=2)
+
+                    if parts[0] == "C" and len(parts) == 3:
+                        current_class = int(parts[1], 16)
+                        entries.setdefault((KIND_CLASS, current_class, 0, 0, 0), parts[2])
+                    elif len(parts[0]) == 4 and len(parts) >= 2:
+                        current_vendor = int(parts[0], 16)
+                        entries.setdefault((KIND_VENDOR, current_vendor, 0, 0, 0), line.split(maxsplit=1)[1])
+                elif line.startswith("\t\t"):
+                    if current_device is not None:
+                        subsystem_vendor_id, subsystem_device_id, subsystem_name = line.strip().split(maxsplit=2)
+                        entries.setdefault((KIND_SUBSYSTEM, current_vendor, current_device, int(subsystem_vendor_id, 16), int(subsystem_device_id, 16)), subsystem_name)
+                    elif current_subclass is not None:
+                        prog_if, prog_if_name = line.strip().split(maxsplit=1)
+                        entries.setdefault((KIND_PROG_IF, current_class, current_subclass, int(prog_if, 16), 0), prog_if_name)
+                elif current_vendor is not None:
+                    device_id, device_name = line.strip().split(maxsplit=1)
+                    current_device = int(device_id, 16)
+                    entries.setdefault((KIND_DEVICE, current_vendor, current_device, 0, 0), device_name)
+                elif current_class is not None:
+                    subclass_id, subclass_name = line.strip().split(maxsplit=1)
+                    current_subclass = int(subclass_id, 16)
+                    entries.setdefault((KIND_SUBCLASS, current_class, current_subclass, 0, 0), subclass_name)
+            except ValueError:
+                continue
+
+        return entries
+
+    def build_index(self, source_stat):
+        entries = self.parse_entries()
+
+        records = []
+        strings = bytearray()
+
+        for key in sorted(entries):
+            name = entries[key].encode("utf-8")[:0xFFFF]
+            records.append(INDEX_RECORD.pack(*key, len(strings), len(name)))
+            strings += name
+
+        header = INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, self.get_source_digest(), source_stat.st_size, source_stat.st_mtime_ns, len(records))
+
+        return header + b"".join(records) + bytes(strings)
+
+    def compile(self, index_path):
+        index_dir = os.path.dirname(index_path)
+        os.makedirs(index_dir, exist_ok=True)
+
+        index_data = self.build_index(os.stat(self.source_path))
+
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=index_dir, prefix=".", suffix=INDEX_EXTENSION)
+        try:
+            with os.fdopen(file_descriptor, "wb") as index_file:
+                index_file.write(index_data)
+            os.chmod(temporary_path, 0o644)
+            os.replace(temporary_path, index_path)
+        except OSError:
+            try:
+                os.remove(temporary_path)
+            except OSError:
+                pass
+            raise
+
+    def open(self, index_path, source_stat):
+        try:
+            with open(index_path, "rb") as index_file:
+                index_buffer = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return False
+
+        try:
+            magic, version, digest, size, mtime_ns, record_count = INDEX_HEADER.unpack_from(index_buffer)
+        except struct.error:
+            index_buffer.close()
+            return False
+
+        if magic != INDEX_MAGIC or version != INDEX_VERSION:
+            index_buffer.close()
+            return False
+
+        if (size, mtime_ns) != (source_stat.st_size, source_stat.st_mtime_ns) and digest != self.get_source_digest():
+            index_buffer.close()
+            return False
+
+        self.load_buffer(index_buffer)
+        return True
+
+    def load_buffer(self, index_buffer):
+        self.buffer = index_buffer
+        self.record_count = INDEX_HEADER.unpack_from(index_buffer)[-1]
+        self.strings_offset = INDEX_HEADER.size + self.record_count * INDEX_RECORD.size
+
+    def lookup(self, kind, *ids):
+        try:
+            return self.names[(kind, ids)]
+        except KeyError:
+            name = self.names[(kind, ids)] = self.search(kind, *ids)
+            return name
+        except TypeError:
+            return None
+
+    def search(self, kind, *ids):
+        try:
+            ids = [int(value, 16) for value in ids]
+            key = INDEX_RECORD.pack(kind, *(ids + [0] * (4 - len(ids))), 0, 0)[:INDEX_KEY_SIZE]
+        except (TypeError, ValueError, struct.error):
+            return None
+
+        low, high = 0, self.record_count
+
+        while low < high:
+            middle = (low + high) // 2
+            record_offset = INDEX_HEADER.size + middle * INDEX_RECORD.size
+
+            if self.buffer[record_offset:record_offset + INDEX_KEY_SIZE] < key:
+                low = middle + 1
+            else:
+                high = middle
+
+        record_offset = INDEX_HEADER.size + low * INDEX_RECORD.size
+
+        if low == self.record_count or self.buffer[record_offset:record_offset + INDEX_KEY_SIZE] != key:
+            return None
+
+        string_offset, string_length = INDEX_RECORD.unpack_from(self.buffer, record_offset)[-2:]
+        string_offset += self.strings_offset
+
+        return self.buffer[string_offset:string_offset + string_length].decode("utf-8")
+
+    def get_vendor_name(self, vendor_id):
+        return self.lookup(KIND_VENDOR, vendor_id)
+
+    def get_device_name(self, vendor_id, device_id):
+        return self.lookup(KIND_DEVICE, vendor_id, device_id)
+
+    def get_subsystem_name(self, vendor_id, device_id, subsystem_vendor_id, subsystem_device_id):
+        return self.lookup(KIND_SUBSYSTEM, vendor_id, device_id, subsystem_vendor_id, subsystem_device_id)
+
+    def get_class_name(self, class_id):
+        return self.lookup(KIND_CLASS, class_id)
+
+    def get_subclass_name(self, class_id, subclass_id):
+        return self.lookup(KIND_SUBCLASS, class_id, subclass_id)
+
+    def get_prog_if_name(self, class_id, subclass_id, prog_if):
+        return self.lookup(KIND_PROG_IF, class_id, subclass_id, prog_if)
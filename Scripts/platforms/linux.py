@@ -1,98 +1,245 @@
-from ..datasets import chipset_data
+from .. import chipset_identifier
+from .. import collection_metrics
 from .. import cpu_identifier
+from .. import cpu_topology
 from .. import device_locator
 from .. import gpu_identifier
+from .. import ids_database
 from .. import run
+from .. import step_scheduler
+from .. import sysfs
 from .. import utils
 import time
 import os
+import re
+import threading
 
 PCI_DEVICES_PATH = "/sys/bus/pci/devices"
 USB_DEVICES_PATH = "/sys/bus/usb/devices"
 
 class LinuxHardwareInfo:
-    def __init__(self, rich_format=True):
+    def __init__(self, rich_format=True, lspci_names=False, sysfs_root=None):
         self.lookup_codename = cpu_identifier.CPUIdentifier().lookup_codename
         self.classify_gpu = gpu_identifier.GPUIdentifier().classify_gpu
-        self.get_device_location_paths = device_locator.LinuxDeviceLocator().get_device_location_paths
+        self.lookup_chipset = chipset_identifier.ChipsetIdentifier().lookup_chipset
+        self.metrics = collection_metrics.CollectionMetrics()
+        self.sysfs = sysfs.SysfsSnapshot(sysfs_root, self.metrics)
+        self.device_locator = device_locator.LinuxDeviceLocator(self.sysfs)
+        self.cpu_topology = cpu_topology.CPUTopology(self.sysfs)
+        self.get_device_location_paths = self.device_locator.get_device_location_paths
         self.run = run.Run().run
         self.utils = utils.Utils(rich_format=rich_format)
-        self.usb_ids = self.utils.read_file(self.utils.get_full_path("Scripts", "datasets", "usb.ids"))
+        self.utils.metrics = self.metrics
+        self.usb_ids = ids_database.load(self.utils.get_full_path("Scripts", "datasets", "usb.ids"))
+        self.pci_ids = ids_database.load(self.utils.get_full_path("Scripts", "datasets", "pci.ids"))
+        self.usb_devices = None
+        self.usb_device_ids = None
+        self.lspci_names = lspci_names
+        self.lspci_devices = None
+        self.pci_bars = None
+        self.cache_lock = threading.Lock()
 
-    def format_value(self, value, type="string"):
-        if not value:
-            return None
-        
-        value = value.strip()
+    def get_uevent_pci_ids(self, uevent):
+        vendor_id = device_id = subsystem_vendor_id = subsystem_device_id = None
 
-        try:
-            if type == "int":
-                return int(value)
-        except:
+        if ":" in uevent.get("PCI_ID", ""):
+            vendor_id, device_id = (value.zfill(4) for value in uevent.get("PCI_ID").split(":"))
+
+        if ":" in uevent.get("PCI_SUBSYS_ID", ""):
+            subsystem_vendor_id, subsystem_device_id = (value.zfill(4) for value in uevent.get("PCI_SUBSYS_ID").split(":"))
+
+        return vendor_id, device_id, subsystem_vendor_id, subsystem_device_id
+
+    def get_uevent_bus_type(self, uevent):
+        if not uevent.get("MODALIAS"):
             return None
-        
-        return value
-    
-    def get_pci_device_name_and_class(self, device_slot_name):
-        output = self.run({
-            "args": ["lspci", "-vmm", "-s", device_slot_name]
-        })
 
-        if output[2] != 0:
+        return uevent.get("MODALIAS").split(":")[0].upper()
+
+    def get_pci_class_name(self, class_code):
+        class_id, subclass_id = class_code[0:2], class_code[2:4]
+
+        return self.pci_ids.get_subclass_name(class_id, subclass_id) or self.pci_ids.get_class_name(class_id) or "Class {}".format(class_code[0:4].lower())
+
+    def get_pci_device_name_and_class(self, device_slot_name):
+        if not device_slot_name:
             return "Unknown", "Unknown"
 
-        device_class = vendor_name = device_name = None
+        if self.lspci_names:
+            device_name, device_class = self.get_pci_device_name_and_class_from_lspci(device_slot_name)
 
-        for line in output[0].splitlines():
-            lower_line = line.lower()
+            if device_name != "Unknown":
+                return device_name, device_class
 
-            if "class" in lower_line:
-                device_class = line.split(":")[-1].strip()
-            elif "vendor" in lower_line:
-                vendor_name = line.split(":")[-1].strip()
-            elif "device" in lower_line:
-                device_name = line.split(":")[-1].strip()
+        device_dir = os.path.join(PCI_DEVICES_PATH, device_slot_name)
 
-            if all((device_class, device_name)):
-                break
+        vendor_id = self.sysfs.read_text(os.path.join(device_dir, "vendor"))
+        device_id = self.sysfs.read_text(os.path.join(device_dir, "device"))
+        class_code = self.sysfs.read_text(os.path.join(device_dir, "class"))
 
-        device_name = " ".join((name for name in (vendor_name, device_name) if name))
+        if not all((vendor_id, device_id, class_code)):
+            return self.get_pci_device_name_and_class_from_lspci(device_slot_name)
 
-        if not device_name:
-            device_name = "Unknown"
+        vendor_id = vendor_id[2:].upper()
+        device_id = device_id[2:].upper()
+        class_code = class_code[2:].upper().zfill(6)
 
-        if not device_class:
-            device_class = "Unknown"
-        else:
-            device_class = device_class.split("[")[0].strip()
+        vendor_name = self.pci_ids.get_vendor_name(vendor_id)
+        device_name = self.pci_ids.get_device_name(vendor_id, device_id)
 
-        return device_name, device_class
+        if not all((vendor_name, device_name)) and not self.lspci_names:
+            lspci_device_name, lspci_device_class = self.get_pci_device_name_and_class_from_lspci(device_slot_name)
 
-    def get_usb_device_name_and_class(self, vendor_id, device_id):
+            if lspci_device_name != "Unknown":
+                return lspci_device_name, lspci_device_class
+
+        device_name = "{} {}".format(vendor_name or "Vendor {}".format(vendor_id.lower()), device_name or "Device {}".format(device_id.lower()))
+
+        return device_name, self.get_pci_class_name(class_code)
+
+    def format_lspci_value(self, value):
+        match = re.match(r"^(.*) \[([0-9a-fA-F]+)\]$", value)
+
+        if not match:
+            return value, None
+
+        name, number = match.groups()
+
+        if name in ("Class", "Vendor", "Device"):
+            name = "{} {}".format(name, number)
+
+        return name, number.upper()
+
+    def get_lspci_devices(self):
+        with self.cache_lock:
+            if self.lspci_devices is None:
+                self.lspci_devices = self.read_lspci_devices()
+
+        return self.lspci_devices
+
+    def read_lspci_devices(self):
+        lspci_devices = {}
+
+        args = ["lspci", "-vmm", "-nn", "-D"]
+
+        if self.sysfs.root:
+            args.extend(["-A", "linux-sysfs", "-O", "sysfs.path={}".format(self.sysfs.get_host_path("/sys/bus/pci"))])
+
+        self.metrics.record("Subprocesses")
         output = self.run({
-            "args": ["lsusb", "-v", "-d", "{}:{}".format(vendor_id, device_id)]
+            "args": args
         })
 
         if output[2] != 0:
+            return lspci_devices
+
+        for record in output[0].split("\n\n"):
+            device_properties = {}
+
+            for line in record.splitlines():
+                if not ":" in line:
+                    continue
+
+                property_name, value = line.split(":", 1)
+                value, number = self.format_lspci_value(value.strip())
+
+                device_properties[property_name] = value
+                if number:
+                    device_properties[property_name + " ID"] = number
+
+            if device_properties.get("Slot"):
+                lspci_devices[device_properties.get("Slot")] = device_properties
+
+        return lspci_devices
+
+    def get_pci_device_name_and_class_from_lspci(self, device_slot_name):
+        device_properties = self.get_lspci_devices().get(device_slot_name)
+
+        if not device_properties:
             return "Unknown", "Unknown"
 
-        device_class = vendor_name = product_name = None
+        device_name = " ".join((name for name in (device_properties.get("Vendor"), device_properties.get("Device")) if name))
+
+        return device_name or "Unknown", device_properties.get("Class") or "Unknown"
+
+    def get_usb_devices(self):
+        with self.cache_lock:
+            if self.usb_devices is None:
+                self.usb_devices = self.read_usb_devices()
+                self.usb_device_ids = {}
+
+                # The first device with a given ID answers lookups, like the node order it is read in
+                for usb_device in self.usb_devices.values():
+                    self.usb_device_ids.setdefault((usb_device["Vendor ID"].upper(), usb_device["Product ID"].upper()), usb_device)
+
+        return self.usb_devices
+
+    def read_usb_devices(self):
+        usb_devices = {}
 
-        for line in output[0].splitlines():
-            lower_line = line.lower()
-            value = " ".join(line.split()[2:]).strip()
+        if not self.sysfs.exists(USB_DEVICES_PATH):
+            return usb_devices
 
-            if not value:
+        nodes = sorted(self.sysfs.listdir(USB_DEVICES_PATH))
+
+        for node in nodes:
+            if ":" in node:
                 continue
 
-            if "bdeviceprotocol" in lower_line:
-                device_class = value
-            elif "idvendor" in lower_line:
-                vendor_name = value
-            elif "idproduct" in lower_line:
-                product_name = value
-            elif "iproduct" in lower_line:
-                product_name = value
+            device_dir = os.path.join(USB_DEVICES_PATH, node)
+
+            vendor_id = self.sysfs.read_text(os.path.join(device_dir, "idVendor"))
+            product_id = self.sysfs.read_text(os.path.join(device_dir, "idProduct"))
+
+            if not all((vendor_id, product_id)):
+                continue
+
+            usb_devices[node] = {
+                "Device Path": device_dir,
+                "Vendor ID": vendor_id,
+                "Product ID": product_id,
+                "Manufacturer": self.sysfs.read_text(os.path.join(device_dir, "manufacturer")),
+                "Product": self.sysfs.read_text(os.path.join(device_dir, "product")),
+                "Class IDs": tuple(self.sysfs.read_text(os.path.join(device_dir, property_name)) for property_name in ("bDeviceClass", "bDeviceSubClass", "bDeviceProtocol")),
+                "Interfaces": {}
+            }
+
+        for node in nodes:
+            usb_device = usb_devices.get(node.split(":")[0])
+
+            if ":" not in node or not usb_device:
+                continue
+
+            interface_dir = os.path.join(USB_DEVICES_PATH, node)
+            driver_path = os.path.join(interface_dir, "driver")
+
+            usb_device["Interfaces"][node] = {
+                "Interface Path": interface_dir,
+                "Class IDs": tuple(self.sysfs.read_text(os.path.join(interface_dir, property_name)) for property_name in ("bInterfaceClass", "bInterfaceSubClass", "bInterfaceProtocol")),
+                "Driver": os.path.basename(self.sysfs.readlink(driver_path)) if self.sysfs.islink(driver_path) else None
+            }
+
+        return usb_devices
+
+    def get_usb_device(self, vendor_id, device_id):
+        self.get_usb_devices()
+
+        return self.usb_device_ids.get((vendor_id.upper(), device_id.upper()))
+
+    def get_usb_device_name_and_class(self, vendor_id, device_id):
+        device_class = None
+
+        vendor_name = self.usb_ids.get_vendor_name(vendor_id)
+        product_name = self.usb_ids.get_device_name(vendor_id, device_id)
+
+        usb_device = self.get_usb_device(vendor_id, device_id)
+
+        if usb_device:
+            vendor_name = vendor_name or usb_device.get("Manufacturer")
+            product_name = usb_device.get("Product") or product_name
+
+            if all(usb_device.get("Class IDs")):
+                device_class = self.usb_ids.get_prog_if_name(*usb_device.get("Class IDs"))
 
         device_name = " ".join((name for name in (vendor_name, product_name) if name))
 
@@ -101,7 +248,85 @@ class LinuxHardwareInfo:
         if not device_class:
             device_class = "Unknown"
 
-        return device_name, device_class       
+        return device_name, device_class
+
+    def get_usb_descriptor_name(self, usb_device):
+        device_name = " ".join(filter(None, [usb_device.get("Manufacturer"), usb_device.get("Product")])).strip()
+
+        if not device_name:
+            device_name, _ = self.get_usb_device_name_and_class(usb_device.get("Vendor ID"), usb_device.get("Product ID"))
+
+        return device_name
+
+    def get_bluetooth_devices(self):
+        bluetooth_devices = []
+
+        BLUETOOTH_DEVICE_PATH = "/sys/class/bluetooth"
+
+        if not self.sysfs.exists(BLUETOOTH_DEVICE_PATH):
+            return bluetooth_devices
+
+        usb_devices = self.get_usb_devices()
+
+        for device in sorted(self.sysfs.listdir(BLUETOOTH_DEVICE_PATH)):
+            device_dir = os.path.join(BLUETOOTH_DEVICE_PATH, device, "device")
+
+            interface = os.path.basename(self.sysfs.realpath(device_dir))
+            usb_device = usb_devices.get(interface.split(":")[0])
+
+            if usb_device and interface in usb_device.get("Interfaces"):
+                bluetooth_devices.append((usb_device.get("Vendor ID"), usb_device.get("Product ID"), "USB"))
+                continue
+
+            uevent = self.sysfs.read_uevent(device_dir)
+
+            if uevent.get("PRODUCT", "").count("/") != 2:
+                continue
+
+            vendor_id, product_id, class_id = (value.zfill(4) for value in uevent.get("PRODUCT").split("/"))
+
+            bluetooth_devices.append((vendor_id, product_id, self.get_uevent_bus_type(uevent)))
+
+        return bluetooth_devices
+
+    def get_pci_bars(self):
+        with self.cache_lock:
+            if self.pci_bars is None:
+                self.pci_bars = self.read_pci_bars()
+
+        return self.pci_bars
+
+    def read_pci_bars(self):
+        pci_bars = {}
+
+        if not self.sysfs.exists(PCI_DEVICES_PATH):
+            return pci_bars
+
+        for device_slot_name in self.sysfs.listdir(PCI_DEVICES_PATH):
+            bars = []
+
+            resource = self.sysfs.read_text(os.path.join(PCI_DEVICES_PATH, device_slot_name, "resource")) or ""
+
+            for index, line in enumerate(resource.splitlines()):
+                try:
+                    start_address, end_address, flags = (int(value, 16) for value in line.split()[:3])
+                except ValueError:
+                    continue
+
+                if not end_address:
+                    continue
+
+                bars.append({
+                    "Index": index,
+                    "Start": start_address,
+                    "End": end_address,
+                    "Size": end_address - start_address + 1,
+                    "Flags": flags
+                })
+
+            pci_bars[device_slot_name] = bars
+
+        return pci_bars
 
     def pci_devices(self):
         self.devices_by_class = {}
@@ -109,13 +334,13 @@ class LinuxHardwareInfo:
 
         pci_devices_data = {}
 
-        if not os.path.exists(PCI_DEVICES_PATH):
+        if not self.sysfs.exists(PCI_DEVICES_PATH):
             return pci_devices_data
         
-        for device_slot_name in os.listdir(PCI_DEVICES_PATH):
+        for device_slot_name in self.sysfs.listdir(PCI_DEVICES_PATH):
             device_dir = os.path.join(PCI_DEVICES_PATH, device_slot_name)
 
-            if not os.path.exists(device_dir):
+            if not self.sysfs.exists(device_dir):
                 continue
 
             device_name, device_class = self.get_pci_device_name_and_class(device_slot_name)
@@ -125,17 +350,17 @@ class LinuxHardwareInfo:
 
             vendor_id = device_id = subsystem_vendor_id = subsystem_device_id = None
 
-            for property_name in os.listdir(device_dir):
+            for property_name in self.sysfs.listdir(device_dir):
                 device_property_path = os.path.join(device_dir, property_name)
 
                 if property_name == "vendor":
-                    vendor_id = self.format_value(self.utils.read_file(device_property_path))
+                    vendor_id = self.sysfs.read_text(device_property_path)
                 elif property_name == "device":
-                    device_id = self.format_value(self.utils.read_file(device_property_path))
+                    device_id = self.sysfs.read_text(device_property_path)
                 elif property_name == "subsystem_vendor":
-                    subsystem_vendor_id = self.format_value(self.utils.read_file(device_property_path))
+                    subsystem_vendor_id = self.sysfs.read_text(device_property_path)
                 elif property_name == "subsystem_device":
-                    subsystem_device_id = self.format_value(self.utils.read_file(device_property_path))
+                    subsystem_device_id = self.sysfs.read_text(device_property_path)
 
             if not all((device_name, vendor_id, device_id)):
                 continue
@@ -160,11 +385,11 @@ class LinuxHardwareInfo:
         return pci_devices_data
           
     def motherboard(self):
-        manufacturer = self.format_value(self.utils.read_file("/sys/class/dmi/id/sys_vendor") or "").split(" ")[0]
-        model = self.format_value(self.utils.read_file("/sys/class/dmi/id/product_name") or "")
+        manufacturer = (self.sysfs.read_text("/sys/class/dmi/id/sys_vendor") or "").split(" ")[0]
+        model = self.sysfs.read_text("/sys/class/dmi/id/product_name") or ""
 
-        board_manufacturer = self.format_value(self.utils.read_file("/sys/class/dmi/id/board_vendor") or "").split(" ")[0]
-        board_model = self.format_value(self.utils.read_file("/sys/class/dmi/id/board_name") or "")
+        board_manufacturer = (self.sysfs.read_text("/sys/class/dmi/id/board_vendor") or "").split(" ")[0]
+        board_model = self.sysfs.read_text("/sys/class/dmi/id/board_name") or ""
 
         for prefix in ("unknown", "manufacturer", "o.e.m.", "product"):
             if prefix in board_manufacturer.lower():
@@ -187,29 +412,16 @@ class LinuxHardwareInfo:
         else:
             system_name = " ".join([manufacturer, model]).strip().upper()
 
-        chipset_model = "Unknown"
-
-        for device in self.devices_by_class.get("ISA bridge", []):
-            if device.get("Device ID") in chipset_data.chipset_controllers:
-                chipset_model = chipset_data.chipset_controllers[device.get("Device ID")]
-                break
+        chipset_model = self.lookup_chipset([device.get("Device ID") for device in self.devices_by_class.get("ISA bridge", [])], system_name)
 
-        for chipset_name in chipset_data.amd_chipsets:
-            if chipset_name in system_name:
-                chipset_model = chipset_name
-                break
+        chassis_type = self.sysfs.read_int("/sys/class/dmi/id/chassis_type")
 
-        system_platform = self.utils.read_file("/sys/class/dmi/id/chassis_type") or "Unspecified"
-
-        try:
-            system_platform = int(self.utils.read_file("/sys/class/dmi/id/chassis_type"))
-
-            if system_platform in (2, 8, 9, 10):
-                system_platform = "Laptop"
-            else:
-                system_platform = "Desktop"
-        except:
+        if chassis_type is None:
             system_platform = "Unspecified"
+        elif chassis_type in (2, 8, 9, 10):
+            system_platform = "Laptop"
+        else:
+            system_platform = "Desktop"
                 
         return {
             "Name": system_name,
@@ -220,36 +432,16 @@ class LinuxHardwareInfo:
     def bios(self):
         bios_info = {}
 
-        bios_info["Version"] = self.format_value(self.utils.read_file("/sys/class/dmi/id/bios_version")) or "Unknown"
-        bios_info["Release Date"] = self.format_value(self.utils.read_file("/sys/class/dmi/id/bios_date")) or "Unknown"
+        bios_info["Version"] = self.sysfs.read_text("/sys/class/dmi/id/bios_version") or "Unknown"
+        bios_info["Release Date"] = self.sysfs.read_text("/sys/class/dmi/id/bios_date") or "Unknown"
 
-        if os.path.exists("/sys/firmware/efi"):
+        if self.sysfs.exists("/sys/firmware/efi"):
             bios_info["Firmware Type"] = "UEFI"
         else:
             bios_info["Firmware Type"] = "BIOS"
 
-        bios_info["Secure Boot"] = "Enabled" if self.format_value(self.utils.read_file("/sys/firmware/efi/efivars/SecureBoot-8be4df61-93ca-11d2-aa0d-00e098032b8c") or "0", "int") else "Disabled"
-        bios_info["Above 4G Decoding"] = "Disabled"
-
-        for class_name in self.devices_by_class:
-            for device in self.devices_by_class[class_name]:
-                if device.get("Device Path"):
-                    device_dir = os.path.join(PCI_DEVICES_PATH, device.get("Device Path"))
-
-                    if os.path.exists(device_dir):
-                        for resource_path, _ in self.utils.find_matching_paths(device_dir, name_filter="resource", type_filter="file"):
-                            try:
-                                resource = self.utils.read_file(os.path.join(device_dir, resource_path))
-
-                                for line in resource.splitlines():
-                                    line = line.strip()
-
-                                    start_address, end_address, flags = line.split()[0:3]
-
-                                    if int(end_address, 16) >= 2**32:
-                                        bios_info["Above 4G Decoding"] = "Enabled"
-                            except:
-                                continue
+        bios_info["Secure Boot"] = "Enabled" if (self.sysfs.read_bytes("/sys/firmware/efi/efivars/SecureBoot-8be4df61-93ca-11d2-aa0d-00e098032b8c") or b"\x00")[-1] == 1 else "Disabled"
+        bios_info["Above 4G Decoding"] = "Enabled" if any(bar.get("End") >= 2**32 for bars in self.get_pci_bars().values() for bar in bars) else "Disabled"
 
         return bios_info
     
@@ -263,39 +455,65 @@ class LinuxHardwareInfo:
 
         return ", ".join(simd_feature_support) if simd_feature_support else "SIMD Capabilities Unknown"
     
-    def cpu(self):
-        try:
-            cpu_cores = self.utils.read_file("/proc/cpuinfo").split("\n\n")
-        except:
-            cpu_cores = []
+    def get_cpu_topology(self):
+        summary = self.cpu_topology.get_summary()
+
+        if summary:
+            return summary
+
+        # Without the sysfs topology, count distinct cores and packages from cpuinfo
+        threads = 0
+        package_id = None
+        cores = set()
+        packages = set()
+
+        for line in (self.sysfs.read_text("/proc/cpuinfo") or "").splitlines():
+            key, separator, value = line.partition(":")
+            key = key.strip()
+            value = value.strip()
+
+            if key == "processor":
+                threads += 1
+                cores.add((None, threads))
+            elif key == "physical id":
+                package_id = value
+                packages.add(value)
+            elif key == "core id":
+                cores.discard((None, threads))
+                cores.add((package_id, value))
 
+        return {
+            "Packages": len(packages) or 1,
+            "Cores": len(cores) or threads,
+            "Threads": threads
+        }
+
+    def cpu(self):
         cpu_brand = None
         cpu_model = None
         cpu_family = model = stepping = None
-        number_of_cores = 0
         flags = None
-        cpu_count = -1
-
-        for cpu_core in cpu_cores:
-            if cpu_core:
-                number_of_cores += 1
-                for line in cpu_core.splitlines():
-                    if not all((cpu_brand, cpu_family, model, cpu_model, stepping, flags)):
-                        if "vendor_id" in line:
-                            cpu_brand = line.split(":")[-1].strip()
-                        elif "cpu family" in line:
-                            cpu_family = line.split(":")[-1].strip()
-                        elif "model name" in line:
-                            cpu_model = line.split(":")[-1].split("with")[0].split("@")[0].replace(" CPU", "").strip()
-                        elif "model" in line:
-                            model = line.split(":")[-1].strip()
-                        elif "stepping" in line:
-                            stepping = line.split(":")[-1].strip()
-                        elif "flags" in line:
-                            flags = line.split(":")[-1].strip()
-                    
-                    if "physical id" in line:
-                        cpu_count = int(line.split(":")[-1].strip())
+
+        # Every processor block repeats the same model, family, stepping and flags, the first one is enough
+        for line in (self.sysfs.read_first_block("/proc/cpuinfo") or "").splitlines():
+            key, separator, value = line.partition(":")
+            key = key.strip()
+            value = value.strip()
+
+            if key == "vendor_id":
+                cpu_brand = value
+            elif key == "cpu family":
+                cpu_family = value
+            elif key == "model name":
+                cpu_model = value.split("with")[0].split("@")[0].replace(" CPU", "").strip()
+            elif key == "model":
+                model = value
+            elif key == "stepping":
+                stepping = value
+            elif key == "flags":
+                flags = value
+
+        topology = self.get_cpu_topology()
 
         if all((cpu_brand, cpu_family, model, cpu_model, stepping, flags)):
             cpu_description = "Family {} Model {} Stepping {}".format(cpu_family, model, stepping)
@@ -305,54 +523,51 @@ class LinuxHardwareInfo:
             elif "AMD" in cpu_brand:
                 cpu_brand = "AMD"
             
-            return {
+            cpu_info = {
                 "Manufacturer": cpu_brand,
                 "Processor Name": cpu_model,
                 "Codename": self.lookup_codename(cpu_model, cpu_description),
-                "Core Count": str(number_of_cores).zfill(2),
-                "CPU Count": str(int(cpu_count) + 1).zfill(2),
-                "SIMD Features": self.get_simd_features(flags)
+                "Core Count": str(topology.get("Cores")).zfill(2),
+                "Thread Count": str(topology.get("Threads")).zfill(2),
+                "CPU Count": str(topology.get("Packages")).zfill(2)
             }
+
+            if "Performance Cores" in topology:
+                cpu_info["Performance Core Count"] = str(topology.get("Performance Cores")).zfill(2)
+                cpu_info["Efficiency Core Count"] = str(topology.get("Efficiency Cores")).zfill(2)
+
+            if "SMT" in topology:
+                cpu_info["SMT"] = topology.get("SMT")
+                cpu_info["NUMA Node Count"] = str(topology.get("NUMA Nodes")).zfill(2)
+
+            cpu_info["SIMD Features"] = self.get_simd_features(flags)
+
+            return cpu_info
        
     def gpu(self):
         gpu_info = {}
+        key_counters = {}
 
         DRM_DEVICES_PATH = "/sys/class/drm"
 
-        if not os.path.exists(DRM_DEVICES_PATH):
+        if not self.sysfs.exists(DRM_DEVICES_PATH):
             return gpu_info
         
-        graphics_devices = self.utils.find_matching_paths(DRM_DEVICES_PATH, name_filter="card", type_filter="dir")
+        graphics_devices = self.utils.find_matching_paths(self.sysfs.get_host_path(DRM_DEVICES_PATH), pattern="card*", type_filter="dir", max_depth=1)
 
         for graphics_device, _ in graphics_devices:
             if "-" in graphics_device:
                 continue
 
             device_dir = os.path.join(DRM_DEVICES_PATH, graphics_device)
-            uevent = self.format_value(self.utils.read_file(os.path.join(device_dir, "device", "uevent")) or "\n")
+            uevent = self.sysfs.read_uevent(os.path.join(device_dir, "device"))
 
             if not uevent:
                 continue
 
-            vendor_id = device_id = subsystem_vendor_id = subsystem_device_id = device_slot_name = bus_type = None
-
-            for line in uevent.splitlines():
-                lower_line = line.lower()
-
-                if "pci_id" in lower_line:
-                    vendor_id, device_id = line.split("=")[-1].split(":")
-
-                    vendor_id = vendor_id.zfill(4)
-                    device_id = device_id.zfill(4)
-                elif "pci_subsys_id" in lower_line:
-                    subsystem_vendor_id, subsystem_device_id = line.split("=")[-1].split(":")
-
-                    subsystem_vendor_id = subsystem_vendor_id.zfill(4)
-                    subsystem_device_id = subsystem_device_id.zfill(4)
-                elif "pci_slot_name" in lower_line:
-                    device_slot_name = line.split("=")[-1]
-                elif "modalias" in lower_line:
-                    bus_type = line.split("=")[-1].split(":")[0].upper()
+            vendor_id, device_id, subsystem_vendor_id, subsystem_device_id = self.get_uevent_pci_ids(uevent)
+            device_slot_name = uevent.get("PCI_SLOT_NAME")
+            bus_type = self.get_uevent_bus_type(uevent)
 
             if not all((bus_type, vendor_id, device_id)):
                 continue
@@ -376,29 +591,11 @@ class LinuxHardwareInfo:
             device_dir = os.path.join(device_dir, "device")
             device_info.update(self.get_device_location_paths(device_dir))
 
-            device_info["Resizable BAR"] = "Disabled"
-
-            if os.path.exists(device_dir):
-                for resource_path, _ in self.utils.find_matching_paths(device_dir, name_filter="resource", type_filter="file"):
-                    try:
-                        resource = self.utils.read_file(os.path.join(device_dir, resource_path))
-                        parts = resource.split()
-
-                        for index in range(0, len(parts), 3):
-                            start_address, end_address, flags = parts[index:index + 3]
-
-                            start_address = int(start_address, 16)
-                            end_address = int(end_address, 16)
-                            memory_size = end_address - start_address + 1
-
-                            if memory_size >= 2**32:
-                                device_info["Resizable BAR"] = "Enabled"
-                    except:
-                        continue
+            device_info["Resizable BAR"] = "Enabled" if any(bar.get("Size") >= 2**32 for bar in self.get_pci_bars().get(device_slot_name, [])) else "Disabled"
 
             device_info["Device Path"] = device_dir
 
-            gpu_info[self.utils.get_unique_key(device_name, gpu_info)] = device_info
+            gpu_info[self.utils.get_unique_key(device_name, gpu_info, key_counters)] = device_info
 
         return dict(sorted(gpu_info.items(), key=lambda item: item[1].get("Device Type", "")))
     
@@ -486,16 +683,17 @@ class LinuxHardwareInfo:
                         
     def monitor(self):
         monitor_info = {}
+        key_counters = {}
 
         for gpu_name, gpu_info in self.result.get("GPU", {}).items():
             gpu_dir = gpu_info.get("Device Path")
             del gpu_info["Device Path"]
 
-            if os.path.exists(gpu_dir):
-                for edid_path, _ in self.utils.find_matching_paths(gpu_dir, name_filter="edid", type_filter="file"):
+            if self.sysfs.exists(gpu_dir):
+                for edid_path, _ in self.utils.find_matching_paths(self.sysfs.get_host_path(gpu_dir), pattern="edid", type_filter="file", max_depth=4, skip_dirs=("power", "i2c-*", "ttm", "hwmon*", "0000:*")):
                     monitor_name = "Unknown"
 
-                    edid_parsed = self.parse_edid(self.utils.read_file(os.path.join(gpu_dir, edid_path)))
+                    edid_parsed = self.parse_edid(self.sysfs.read_bytes(os.path.join(gpu_dir, edid_path)))
 
                     if all((edid_parsed.get("manufacturer_id"), edid_parsed.get("product_code"))):
                         monitor_name = "{}{}".format(edid_parsed.get("manufacturer_id"), edid_parsed.get("product_code"))
@@ -506,16 +704,16 @@ class LinuxHardwareInfo:
 
                     monitor_dir = os.path.join(gpu_dir, os.path.dirname(edid_path))
                     
-                    for property_name in os.listdir(monitor_dir):
+                    for property_name in self.sysfs.listdir(monitor_dir):
                         monitor_property_path = os.path.join(monitor_dir, property_name)
 
                         if property_name == "status":
-                            connected = "connected" == self.format_value(self.utils.read_file(monitor_property_path))
+                            connected = "connected" == self.sysfs.read_text(monitor_property_path)
                             
                             if not connected:
                                 break
                         elif property_name == "modes":
-                            for mode in self.format_value(self.utils.read_file(monitor_property_path) or "\n").splitlines():
+                            for mode in (self.sysfs.read_text(monitor_property_path) or "").splitlines():
                                 try:
                                     h_active, v_active = map(int, mode.split("x"))
 
@@ -534,7 +732,7 @@ class LinuxHardwareInfo:
                     except:
                         connector_type = "Uninitialized"
 
-                    monitor_info[self.utils.get_unique_key(monitor_name, monitor_info)] = {
+                    monitor_info[self.utils.get_unique_key(monitor_name, monitor_info, key_counters)] = {
                         "Connector Type": connector_type,
                         "Resolution": max_resolution,
                         "Connected GPU": gpu_name
@@ -544,38 +742,23 @@ class LinuxHardwareInfo:
                     
     def network(self):
         network_info = {}
+        key_counters = {}
 
         NET_DEVICES_PATH = "/sys/class/net"
 
-        if not os.path.exists(NET_DEVICES_PATH):
+        if not self.sysfs.exists(NET_DEVICES_PATH):
             return network_info
         
-        for device in os.listdir(NET_DEVICES_PATH):
+        for device in self.sysfs.listdir(NET_DEVICES_PATH):
             device_dir = os.path.join(NET_DEVICES_PATH, device)
-            uevent = self.format_value(self.utils.read_file(os.path.join(device_dir, "device", "uevent")) or "\n")
+            uevent = self.sysfs.read_uevent(os.path.join(device_dir, "device"))
 
             if not uevent:
                 continue
 
-            vendor_id = device_id = subsystem_vendor_id = subsystem_device_id = device_slot_name = bus_type = None
-
-            for line in uevent.splitlines():
-                lower_line = line.lower()
-
-                if "pci_id" in lower_line:
-                    vendor_id, device_id = line.split("=")[-1].split(":")
-
-                    vendor_id = vendor_id.zfill(4)
-                    device_id = device_id.zfill(4)
-                elif "pci_subsys_id" in lower_line:
-                    subsystem_vendor_id, subsystem_device_id = line.split("=")[-1].split(":")
-
-                    subsystem_vendor_id = subsystem_vendor_id.zfill(4)
-                    subsystem_device_id = subsystem_device_id.zfill(4)
-                elif "pci_slot_name" in lower_line:
-                    device_slot_name = line.split("=")[-1]
-                elif "modalias" in lower_line:
-                    bus_type = line.split("=")[-1].split(":")[0].upper()
+            vendor_id, device_id, subsystem_vendor_id, subsystem_device_id = self.get_uevent_pci_ids(uevent)
+            device_slot_name = uevent.get("PCI_SLOT_NAME")
+            bus_type = self.get_uevent_bus_type(uevent)
 
             if not all((vendor_id, device_id)):
                 continue
@@ -592,16 +775,17 @@ class LinuxHardwareInfo:
 
             device_info.update(self.get_device_location_paths(device_dir))
 
-            network_info[self.utils.get_unique_key(device_name, network_info)] = device_info
+            network_info[self.utils.get_unique_key(device_name, network_info, key_counters)] = device_info
 
         return network_info
     
     def sound(self):
         sound_info = {}
+        key_counters = {}
         audio_endpoints_by_device_path = {}
         seen_cards = set()
-        if os.path.exists("/sys/class/sound"):
-            for card in os.listdir("/sys/class/sound"):
+        if self.sysfs.exists("/sys/class/sound"):
+            for card in self.sysfs.listdir("/sys/class/sound"):
                 if not card.startswith("card"):
                     continue
                 
@@ -613,44 +797,44 @@ class LinuxHardwareInfo:
                 card_path = os.path.join("/sys/class/sound", card)
                 device_link = os.path.join(card_path, "device")
                 
-                if not os.path.exists(device_link):
+                if not self.sysfs.exists(device_link):
                     continue
                 
                 vendor_id = device_id = None
 
-                for property_name in os.listdir(device_link):
+                for property_name in self.sysfs.listdir(device_link):
                     card_property_path = os.path.join(device_link, property_name)
 
                     if property_name == "vendor":
-                        vendor_id = self.format_value(self.utils.read_file(card_property_path))
+                        vendor_id = self.sysfs.read_text(card_property_path)
                     elif property_name == "device":
-                        device_id = self.format_value(self.utils.read_file(card_property_path))
+                        device_id = self.sysfs.read_text(card_property_path)
                 
                 if not all((vendor_id, device_id)):
                     continue
                 
                 card_device_id = "{}-{}".format(vendor_id[2:], device_id[2:]).upper()
 
-                sound_device_dirs = self.utils.find_matching_paths(device_link, name_filter="hdaudio", type_filter="dir")
+                sound_device_dirs = self.utils.find_matching_paths(self.sysfs.get_host_path(device_link), pattern="*hdaudio*", type_filter="dir", max_depth=2, skip_dirs=("power", "sound", "*hdaudio*"))
                 
                 for sound_device_dir, _ in sound_device_dirs:
                     codec_name = "Unknown"
                     codec_id = subsystem_id = bus_type = None
 
-                    for property_name in os.listdir(os.path.join(device_link, sound_device_dir)):
+                    for property_name in self.sysfs.listdir(os.path.join(device_link, sound_device_dir)):
                         codec_property_path = os.path.join(device_link, sound_device_dir, property_name)
 
                         if "chip_name" == property_name:
-                            codec_name = self.format_value(self.utils.read_file(codec_property_path))
+                            codec_name = self.sysfs.read_text(codec_property_path)
                         elif "vendor_name" == property_name:
-                            codec_vendor = self.format_value(self.utils.read_file(codec_property_path))
+                            codec_vendor = self.sysfs.read_text(codec_property_path)
                         elif "vendor_id" == property_name:
-                            codec_id = self.format_value(self.utils.read_file(codec_property_path))[2:].upper()
+                            codec_id = self.sysfs.read_text(codec_property_path)[2:].upper()
                             codec_id = "{}-{}".format(codec_id[:4], codec_id[4:])
                         elif "subsystem_id" == property_name:
-                            subsystem_id = self.format_value(self.utils.read_file(codec_property_path))[2:].upper()
+                            subsystem_id = self.sysfs.read_text(codec_property_path)[2:].upper()
                         elif "modalias" == property_name:
-                            bus_type = self.format_value(self.utils.read_file(codec_property_path).split(":")[0].upper())
+                            bus_type = self.sysfs.read_text(codec_property_path).split(":")[0].upper()
 
                     if all((codec_vendor, codec_name)):
                         codec_name = "{} {}".format(codec_vendor, codec_name)
@@ -664,28 +848,23 @@ class LinuxHardwareInfo:
                         }
                         seen_cards.add(subsystem_id)
                         seen_cards.add(subsystem_id[4:] + subsystem_id[:4])
-                        sound_info[self.utils.get_unique_key(codec_name, sound_info)] = codec_info
+                        sound_info[self.utils.get_unique_key(codec_name, sound_info, key_counters)] = codec_info
 
-                real_device_path = os.path.realpath(device_link)
+                real_device_path = self.sysfs.realpath(device_link)
                 device_basename = os.path.basename(real_device_path)
                 
                 endpoints = []
                 
                 proc_card_path = "/proc/asound/card{}".format(card_index)
-                if os.path.exists(proc_card_path):
-                    for pcm in os.listdir(proc_card_path):
+                if self.sysfs.exists(proc_card_path):
+                    for pcm in self.sysfs.listdir(proc_card_path):
                         if pcm.startswith("pcm") and (pcm.endswith("p") or pcm.endswith("c")):
-                            pcm_info_path = os.path.join(proc_card_path, pcm, "info")
-                            if os.path.exists(pcm_info_path):
-                                try:
-                                    info_content = self.utils.read_file(pcm_info_path)
-                                    for line in info_content.splitlines():
-                                        if line.startswith("name:"):
-                                            name = line.split(":", 1)[1].strip()
-                                            if name and name not in endpoints:
-                                                endpoints.append(name)
-                                except:
-                                    pass
+                            info_content = self.sysfs.read_text(os.path.join(proc_card_path, pcm, "info")) or ""
+                            for line in info_content.splitlines():
+                                if line.startswith("name:"):
+                                    name = line.split(":", 1)[1].strip()
+                                    if name and name not in endpoints:
+                                        endpoints.append(name)
                 
                 if endpoints:
                     if device_basename not in audio_endpoints_by_device_path:
@@ -715,7 +894,7 @@ class LinuxHardwareInfo:
                     if device_slot in audio_endpoints_by_device_path:
                         sound_device_info["Audio Endpoints"] = sorted(list(set(audio_endpoints_by_device_path[device_slot])))
 
-                    sound_info[self.utils.get_unique_key(device_name, sound_info)] = sound_device_info
+                    sound_info[self.utils.get_unique_key(device_name, sound_info, key_counters)] = sound_device_info
                 else:
                     device_subsystem_id = (device.get("Subsystem ID"), device.get("Subsystem ID")[4:] + device.get("Subsystem ID")[:4])
                     sound_device_info = next((info for info in sound_info.values() if info.get("Subsystem ID") in device_subsystem_id ), None)
@@ -729,108 +908,43 @@ class LinuxHardwareInfo:
                     if device_slot in audio_endpoints_by_device_path:
                         sound_device_info["Audio Endpoints"] = sorted(list(set(audio_endpoints_by_device_path[device_slot])))
 
-        if os.path.exists(USB_DEVICES_PATH):
-            for device in os.listdir(USB_DEVICES_PATH):
-                device_dir = os.path.join(USB_DEVICES_PATH, device)
-                if not os.path.isdir(device_dir):
-                    continue
-                
-                is_audio = False
-                
-                b_device_class_path = os.path.join(device_dir, "bDeviceClass")
-                b_device_class = self.format_value(self.utils.read_file(b_device_class_path))
-                
-                if b_device_class == "01":
-                    is_audio = True
-                else:
-                    for interface in os.listdir(device_dir):
-                        if interface.startswith(device + ":"):
-                            interface_dir = os.path.join(device_dir, interface)
-                            b_interface_class_path = os.path.join(interface_dir, "bInterfaceClass")
-                            if os.path.exists(b_interface_class_path):
-                                b_interface_class = self.format_value(self.utils.read_file(b_interface_class_path))
-                                if b_interface_class == "01":
-                                    is_audio = True
-                                    break
-                
-                if not is_audio:
-                    continue
-                
-                vendor_path = os.path.join(device_dir, "idVendor")
-                product_path = os.path.join(device_dir, "idProduct")
-                product_name_path = os.path.join(device_dir, "product")
-                manufacturer_path = os.path.join(device_dir, "manufacturer")
-
-                vendor_id = self.format_value(self.utils.read_file(vendor_path))
-                product_id = self.format_value(self.utils.read_file(product_path))
-
-                if not all((vendor_id, product_id)):
-                    continue
-
-                product_name = self.format_value(self.utils.read_file(product_name_path)) or ""
-                manufacturer_name = self.format_value(self.utils.read_file(manufacturer_path)) or ""
-                
-                device_name = " ".join(filter(None, [manufacturer_name, product_name])).strip()
-
-                if not device_name:
-                    device_name, _ = self.get_usb_device_name_and_class(vendor_id, product_id)
-                
-                sound_device_info = {
-                    "Bus Type": "USB",
-                    "Device ID": "{}-{}".format(vendor_id, product_id).upper()
-                }
-                
-                if device in audio_endpoints_by_device_path:
-                    sound_device_info["Audio Endpoints"] = sorted(list(set(audio_endpoints_by_device_path[device])))
-
-                sound_info[self.utils.get_unique_key(device_name, sound_info)] = sound_device_info
-        
-        BLUETOOTH_DEVICE_PATH = "/sys/class/bluetooth"
-
-        if os.path.exists(BLUETOOTH_DEVICE_PATH):
-            for device in os.listdir(BLUETOOTH_DEVICE_PATH):
-                device_dir = os.path.join(BLUETOOTH_DEVICE_PATH, device)
-                uevent = self.format_value(self.utils.read_file(os.path.join(device_dir, "device", "uevent")) or "\n")
-
-                if not uevent:
-                    continue
-
-                vendor_id = product_id = class_id = bus_type = None
+        for device, usb_device in self.get_usb_devices().items():
+            if usb_device.get("Class IDs")[0] != "01" and not any(interface.get("Class IDs")[0] == "01" for interface in usb_device.get("Interfaces").values()):
+                continue
 
-                for line in uevent.splitlines():
-                    lower_line = line.lower()
+            device_name = self.get_usb_descriptor_name(usb_device)
 
-                    if "product" in lower_line:
-                        vendor_id, product_id, class_id = line.split("=")[-1].split("/")
+            sound_device_info = {
+                "Bus Type": "USB",
+                "Device ID": "{}-{}".format(usb_device.get("Vendor ID"), usb_device.get("Product ID")).upper()
+            }
 
-                        vendor_id = vendor_id.zfill(4)
-                        product_id = product_id.zfill(4)
-                        class_id = class_id.zfill(4)
-                    elif "modalias" in lower_line:
-                        bus_type = line.split("=")[-1].split(":")[0].upper()
+            if device in audio_endpoints_by_device_path:
+                sound_device_info["Audio Endpoints"] = sorted(list(set(audio_endpoints_by_device_path[device])))
 
-                if not all((vendor_id, product_id)):
-                    continue
+            sound_info[self.utils.get_unique_key(device_name, sound_info, key_counters)] = sound_device_info
 
-                device_name, device_class = self.get_usb_device_name_and_class(vendor_id, product_id)
+        for vendor_id, product_id, bus_type in self.get_bluetooth_devices():
+            device_name, device_class = self.get_usb_device_name_and_class(vendor_id, product_id)
 
-                sound_device_info = {
-                    "Bus Type": bus_type,
-                    "Device ID": "{}-{}".format(vendor_id, product_id).upper()
-                }
+            sound_device_info = {
+                "Bus Type": bus_type,
+                "Device ID": "{}-{}".format(vendor_id, product_id).upper()
+            }
 
-                sound_info[self.utils.get_unique_key(device_name, sound_info)] = sound_device_info
+            sound_info[self.utils.get_unique_key(device_name, sound_info, key_counters)] = sound_device_info
 
         return sound_info
 
     def usb_controllers(self):
         usb_controller_info = {}
+        key_counters = {}
 
         for device in self.devices_by_class.get("USB controller", []):
             device_name = device.get("Name", "Unknown")
             device_dir = os.path.join(PCI_DEVICES_PATH, device.get("Device Path"))
 
-            if not os.path.exists(device_dir):
+            if not self.sysfs.exists(device_dir):
                 continue
 
             controller_info = {
@@ -847,7 +961,7 @@ class LinuxHardwareInfo:
             if device.get("ACPI Path"):
                 controller_info["ACPI Path"] = device.get("ACPI Path")
 
-            usb_controller_info[self.utils.get_unique_key(device_name, usb_controller_info)] = controller_info
+            usb_controller_info[self.utils.get_unique_key(device_name, usb_controller_info, key_counters)] = controller_info
 
         return usb_controller_info
 
@@ -859,12 +973,9 @@ class LinuxHardwareInfo:
         vendor_path = os.path.join(device_dir, "id", "vendor")
         product_path = os.path.join(device_dir, "id", "product")
         
-        if not os.path.exists(bustype_path):
-            return device_info
-            
-        try:
-            bustype_val = int(self.utils.read_file(bustype_path).strip(), 16)
-        except:
+        bustype_val = self.sysfs.read_hex(bustype_path)
+
+        if bustype_val is None:
             return device_info
         
         if bustype_val == 0x03:
@@ -881,14 +992,14 @@ class LinuxHardwareInfo:
             device_info["Bus Type"] = "HID"
         
         try:
-            vendor_id = self.utils.read_file(vendor_path).strip().zfill(4).upper()
-            product_id = self.utils.read_file(product_path).strip().zfill(4).upper()
+            vendor_id = self.sysfs.read_text(vendor_path).zfill(4).upper()
+            product_id = self.sysfs.read_text(product_path).zfill(4).upper()
             
             if vendor_id != "0000" and product_id != "0000":
                 device_info["Device ID"] = "{}-{}".format(vendor_id, product_id)
             else:
                 name_path = os.path.join(device_dir, "name")
-                device_name = (self.utils.read_file(name_path) or "").strip()
+                device_name = self.sysfs.read_text(name_path) or ""
                 if device_name:
                     device_info["Device"] = device_name.replace(" ", "").upper()[:8]
         except:
@@ -899,19 +1010,15 @@ class LinuxHardwareInfo:
     def get_input_device_type(self, device_dir, device_name):
         """Determine the device type (Keyboard/Mouse/PS2) from device capabilities."""
         bustype_path = os.path.join(device_dir, "id", "bustype")
-        if os.path.exists(bustype_path):
-            try:
-                bustype_val = int(self.utils.read_file(bustype_path).strip(), 16)
-                if bustype_val == 0x11:
-                    return "PS/2"
-                elif bustype_val == 0x18:
-                    return "I2C"
-            except:
-                pass
+        bustype_val = self.sysfs.read_hex(bustype_path)
+        if bustype_val == 0x11:
+            return "PS/2"
+        elif bustype_val == 0x18:
+            return "I2C"
 
         capabilities_path = os.path.join(device_dir, "capabilities")
         
-        if not os.path.exists(capabilities_path):
+        if not self.sysfs.exists(capabilities_path):
             return None
         
         key_caps_path = os.path.join(capabilities_path, "key")
@@ -922,26 +1029,17 @@ class LinuxHardwareInfo:
         has_relative = False
         has_absolute = False
         
-        try:
-            key_caps = self.utils.read_file(key_caps_path)
-            if key_caps and key_caps.strip() != "0":
-                has_keys = True
-        except:
-            pass
-        
-        try:
-            rel_caps = self.utils.read_file(rel_caps_path)
-            if rel_caps and rel_caps.strip() != "0":
-                has_relative = True
-        except:
-            pass
-        
-        try:
-            abs_caps = self.utils.read_file(abs_caps_path)
-            if abs_caps and abs_caps.strip() != "0":
-                has_absolute = True
-        except:
-            pass
+        key_caps = self.sysfs.read_text(key_caps_path)
+        if key_caps and key_caps != "0":
+            has_keys = True
+
+        rel_caps = self.sysfs.read_text(rel_caps_path)
+        if rel_caps and rel_caps != "0":
+            has_relative = True
+
+        abs_caps = self.sysfs.read_text(abs_caps_path)
+        if abs_caps and abs_caps != "0":
+            has_absolute = True
         
         lower_name = device_name.lower()
         
@@ -958,10 +1056,11 @@ class LinuxHardwareInfo:
                 
     def input(self):
         input_info = {}
+        key_counters = {}
 
         INPUT_DEVICE_PATH = "/sys/class/input"
 
-        if not os.path.exists(INPUT_DEVICE_PATH):
+        if not self.sysfs.exists(INPUT_DEVICE_PATH):
             return input_info
         
         filter_words = ("wireless radio controls", "vendor-defined device", "consumer control device", "system controller", "pc speaker", "power button", "sleep button", "lid switch")
@@ -969,10 +1068,10 @@ class LinuxHardwareInfo:
         seen_ids = set()
         
         input_devices = []
-        for device in os.listdir(INPUT_DEVICE_PATH):
+        for device in self.sysfs.listdir(INPUT_DEVICE_PATH):
             device_dir = os.path.join(INPUT_DEVICE_PATH, device)
 
-            if not os.path.isdir(device_dir):
+            if not self.sysfs.isdir(device_dir):
                 continue
 
             if "input" not in device:
@@ -984,7 +1083,7 @@ class LinuxHardwareInfo:
             
         for device, device_dir in input_devices:
             name_path = os.path.join(device_dir, "name")
-            device_name = (self.utils.read_file(name_path) or device).strip()
+            device_name = self.sysfs.read_text(name_path) or device
             
             device_info = self.parse_input_device_path(device_dir)
             
@@ -1005,11 +1104,12 @@ class LinuxHardwareInfo:
             device_info["Device Type"] = device_type
             
             if device_info.get("Bus Type") in ("USB", "HID"):
-                if device_info.get("Device ID") and self.usb_ids:
+                if device_info.get("Device ID"):
                     try:
                         vendor_id = device_info.get("Device ID")[:4]
                         product_id = device_info.get("Device ID")[5:]
-                        usb_device_name = self.usb_ids.get(vendor_id, {}).get("devices", {}).get(product_id)
+                        usb_device = self.get_usb_device(vendor_id, product_id)
+                        usb_device_name = self.usb_ids.get_device_name(vendor_id, product_id) or (usb_device and usb_device.get("Product"))
                         if usb_device_name:
                             device_name = usb_device_name
                     except:
@@ -1017,12 +1117,13 @@ class LinuxHardwareInfo:
                 device_info["Bus Type"] = "USB"
                 del device_info["Device Type"]
 
-            input_info[self.utils.get_unique_key(device_name, input_info)] = device_info
+            input_info[self.utils.get_unique_key(device_name, input_info, key_counters)] = device_info
 
         return input_info
     
     def storage_controllers(self):
         storage_controller_info = {}
+        key_counters = {}
 
         for device in self.devices_by_class.get("Non-Volatile memory controller", []) + self.devices_by_class.get("SATA controller", []):
             device_name = device.get("Name", "Unknown")
@@ -1042,92 +1143,63 @@ class LinuxHardwareInfo:
             if device.get("ACPI Path"):
                 device_info["ACPI Path"] = device.get("ACPI Path")
 
-            model_paths = self.utils.find_matching_paths(device_dir, name_filter="model", type_filter="file")
+            model_paths = self.utils.find_matching_paths(self.sysfs.get_host_path(device_dir), pattern="model", type_filter="file", max_depth=5, skip_dirs=("block", "power", "queue", "hwmon*", "nvme*n*", "ng*n*", "bsg", "scsi_*", "0000:*"))
             disk_drive_names = []
 
             for model_path, _ in model_paths:
                 try:
-                    disk_drive_names.append(self.format_value(self.utils.read_file(os.path.join(device_dir, model_path))))
+                    disk_drive_names.append(self.sysfs.read_text(os.path.join(device_dir, model_path)))
                 except:
                     pass
 
             if disk_drive_names:
                 device_info["Disk Drives"] = disk_drive_names
 
-            storage_controller_info[self.utils.get_unique_key(device_name, storage_controller_info)] = device_info
+            storage_controller_info[self.utils.get_unique_key(device_name, storage_controller_info, key_counters)] = device_info
 
         return storage_controller_info
 
     def biometric(self):
         biometric_info = {}
+        key_counters = {}
 
-        if os.path.exists(USB_DEVICES_PATH):
-            for device in os.listdir(USB_DEVICES_PATH):
-                device_dir = os.path.join(USB_DEVICES_PATH, device)
+        for usb_device in self.get_usb_devices().values():
+            device_name = self.get_usb_descriptor_name(usb_device)
 
-                if not os.path.isdir(device_dir):
-                    continue
+            lower_name = device_name.lower()
+            is_biometric = self.utils.contains_any(("fingerprint", "biometric", "finger print", "fprint"), lower_name)
 
-                vendor_path = os.path.join(device_dir, "idVendor")
-                product_path = os.path.join(device_dir, "idProduct")
-                product_name_path = os.path.join(device_dir, "product")
-                manufacturer_path = os.path.join(device_dir, "manufacturer")
+            if not is_biometric:
+                for interface in usb_device.get("Interfaces").values():
+                    driver_name = (interface.get("Driver") or "").lower()
 
-                vendor_id = self.format_value(self.utils.read_file(vendor_path))
-                product_id = self.format_value(self.utils.read_file(product_path))
+                    if interface.get("Class IDs")[0] == "ff" and ("fingerprint" in driver_name or "fprint" in driver_name):
+                        is_biometric = True
+                        break
 
-                if not all((vendor_id, product_id)):
-                    continue
-
-                product_name = self.format_value(self.utils.read_file(product_name_path)) or ""
-                manufacturer_name = self.format_value(self.utils.read_file(manufacturer_path)) or ""
-                
-                device_name = " ".join(filter(None, [manufacturer_name, product_name])).strip()
-
-                if not device_name:
-                    device_name, _ = self.get_usb_device_name_and_class(vendor_id, product_id)
-
-                lower_name = device_name.lower()
-                is_biometric = self.utils.contains_any(("fingerprint", "biometric", "finger print", "fprint"), lower_name)
-
-                if not is_biometric:
-                    interface_dirs = self.utils.find_matching_paths(device_dir, name_filter=":", type_filter="dir")
-                    for interface_dir, _ in interface_dirs:
-                        interface_class_path = os.path.join(device_dir, interface_dir, "bInterfaceClass")
-                        interface_class = self.format_value(self.utils.read_file(interface_class_path))
-                        if interface_class == "ff":
-                            modalias_path = os.path.join(device_dir, interface_dir, "modalias")
-                            modalias = self.format_value(self.utils.read_file(modalias_path)) or ""
-                            driver_path = os.path.join(device_dir, interface_dir, "driver")
-                            if os.path.islink(driver_path):
-                                driver_name = os.path.basename(os.readlink(driver_path)).lower()
-                                if "fingerprint" in driver_name or "fprint" in driver_name:
-                                    is_biometric = True
-                                    break
-
-                if not is_biometric:
-                    continue
+            if not is_biometric:
+                continue
 
-                device_info = {
-                    "Bus Type": "USB",
-                    "Device ID": "{}-{}".format(vendor_id, product_id).upper()
-                }
+            device_info = {
+                "Bus Type": "USB",
+                "Device ID": "{}-{}".format(usb_device.get("Vendor ID"), usb_device.get("Product ID")).upper()
+            }
 
-                biometric_info[self.utils.get_unique_key(device_name, biometric_info)] = device_info
+            biometric_info[self.utils.get_unique_key(device_name, biometric_info, key_counters)] = device_info
 
         PLATFORM_DEVICE_PATH = "/sys/bus/platform/devices"
-        if os.path.exists(PLATFORM_DEVICE_PATH):
-            for device in os.listdir(PLATFORM_DEVICE_PATH):
+        if self.sysfs.exists(PLATFORM_DEVICE_PATH):
+            for device in self.sysfs.listdir(PLATFORM_DEVICE_PATH):
                 device_dir = os.path.join(PLATFORM_DEVICE_PATH, device)
                 
-                if not os.path.isdir(device_dir):
+                if not self.sysfs.isdir(device_dir):
                     continue
 
                 description_path = os.path.join(device_dir, "description")
                 modalias_path = os.path.join(device_dir, "modalias")
                 
-                description = (self.format_value(self.utils.read_file(description_path)) or "").lower()
-                modalias = (self.format_value(self.utils.read_file(modalias_path)) or "").lower()
+                description = (self.sysfs.read_text(description_path) or "").lower()
+                modalias = (self.sysfs.read_text(modalias_path) or "").lower()
                 
                 if self.utils.contains_any(("fingerprint", "biometric", "fprint"), description) or \
                    self.utils.contains_any(("fingerprint", "biometric", "fprint"), modalias):
@@ -1136,41 +1208,15 @@ class LinuxHardwareInfo:
                         "Bus Type": "ACPI",
                         "Device": hid
                     }
-                    biometric_info[self.utils.get_unique_key(description or hid, biometric_info)] = device_info
+                    biometric_info[self.utils.get_unique_key(description or hid, biometric_info, key_counters)] = device_info
 
         return biometric_info
         
     def bluetooth(self):
         bluetooth_info = {}
+        key_counters = {}
         
-        BLUETOOTH_DEVICE_PATH = "/sys/class/bluetooth"
-
-        if not os.path.exists(BLUETOOTH_DEVICE_PATH):
-            return bluetooth_info
-
-        for device in os.listdir(BLUETOOTH_DEVICE_PATH):
-            uevent = self.format_value(self.utils.read_file(os.path.join(BLUETOOTH_DEVICE_PATH, device, "device", "uevent")) or "\n")
-
-            if not uevent:
-                continue
-
-            vendor_id = product_id = class_id = bus_type = None
-
-            for line in uevent.splitlines():
-                lower_line = line.lower()
-
-                if "product" in lower_line:
-                    vendor_id, product_id, class_id = line.split("=")[-1].split("/")
-
-                    vendor_id = vendor_id.zfill(4)
-                    product_id = product_id.zfill(4)
-                    class_id = class_id.zfill(4)
-                elif "modalias" in lower_line:
-                    bus_type = line.split("=")[-1].split(":")[0].upper()
-            
-            if not all((vendor_id, product_id)):
-                continue
-
+        for vendor_id, product_id, bus_type in self.get_bluetooth_devices():
             device_name, device_class = self.get_usb_device_name_and_class(vendor_id, product_id)
 
             device_info = {}
@@ -1180,25 +1226,26 @@ class LinuxHardwareInfo:
 
             device_info["Device ID"] = "{}-{}".format(vendor_id, product_id).upper()
 
-            bluetooth_info[self.utils.get_unique_key(device_name, bluetooth_info)] = device_info
+            bluetooth_info[self.utils.get_unique_key(device_name, bluetooth_info, key_counters)] = device_info
 
         return bluetooth_info
                  
     def sd_controller(self):
         sd_controller_info = {}
+        key_counters = {}
 
         MMC_DEVICE_PATH = "/sys/class/mmc_host"
 
-        if not os.path.exists(MMC_DEVICE_PATH):
+        if not self.sysfs.exists(MMC_DEVICE_PATH):
             return sd_controller_info
         
-        for device in os.listdir(MMC_DEVICE_PATH):
+        for device in self.sysfs.listdir(MMC_DEVICE_PATH):
             device_dir = os.path.join(MMC_DEVICE_PATH, device, "device", "firmware_node")
 
-            if not os.path.exists(device_dir):
+            if not self.sysfs.exists(device_dir):
                 continue
 
-            physical_nodes = self.utils.find_matching_paths(device_dir, name_filter="physical_node", type_filter="dir")
+            physical_nodes = list(self.utils.find_matching_paths(self.sysfs.get_host_path(device_dir), pattern="physical_node*", type_filter="dir", max_depth=1))
 
             if not physical_nodes:
                 continue
@@ -1206,26 +1253,18 @@ class LinuxHardwareInfo:
             vendor_id = device_id = subsystem_vendor_id = subsystem_device_id = device_slot_name = bus_type = None
 
             for physical_node, _ in physical_nodes:
-                uevent = self.format_value(self.utils.read_file(os.path.join(device_dir, physical_node, "uevent")) or "\n")
-
-                for line in uevent.splitlines():
-                    lower_line = line.lower()
+                uevent = self.sysfs.read_uevent(os.path.join(device_dir, physical_node))
+                node_ids = self.get_uevent_pci_ids(uevent)
 
-                    if "pci_id" in lower_line:
-                        vendor_id, device_id = line.split("=")[-1].split(":")
+                if all(node_ids[:2]):
+                    vendor_id, device_id = node_ids[:2]
+                if all(node_ids[2:]):
+                    subsystem_vendor_id, subsystem_device_id = node_ids[2:]
 
-                        vendor_id = vendor_id.zfill(4)
-                        device_id = device_id.zfill(4)
-                    elif "pci_subsys_id" in lower_line:
-                        subsystem_vendor_id, subsystem_device_id = line.split("=")[-1].split(":")
+                device_slot_name = uevent.get("PCI_SLOT_NAME") or device_slot_name
 
-                        subsystem_vendor_id = subsystem_vendor_id.zfill(4)
-                        subsystem_device_id = subsystem_device_id.zfill(4)
-                    elif "pci_slot_name" in lower_line:
-                        device_slot_name = line.split("=")[-1]
-                    elif "modalias" in lower_line:
-                        if bus_type not in ("PCI", "USB"):
-                            bus_type = line.split("=")[-1].split(":")[0].upper()
+                if bus_type not in ("PCI", "USB"):
+                    bus_type = self.get_uevent_bus_type(uevent) or bus_type
 
             if not all((bus_type, vendor_id, device_id)):
                 continue
@@ -1242,41 +1281,42 @@ class LinuxHardwareInfo:
 
             device_info.update(self.get_device_location_paths(os.path.dirname(device_dir)))
 
-            sd_controller_info[self.utils.get_unique_key(device_name, sd_controller_info)] = device_info
+            sd_controller_info[self.utils.get_unique_key(device_name, sd_controller_info, key_counters)] = device_info
 
         return sd_controller_info
         
     def system_devices(self):
         system_device_info = {}
+        key_counters = {}
 
         PLATFORM_DEVICE_PATH = "/sys/bus/platform/devices"
 
-        if not os.path.exists(PLATFORM_DEVICE_PATH):
+        if not self.sysfs.exists(PLATFORM_DEVICE_PATH):
             return system_device_info
         
-        for device in os.listdir(PLATFORM_DEVICE_PATH):
+        for device in self.sysfs.listdir(PLATFORM_DEVICE_PATH):
             device_dir = os.path.join(PLATFORM_DEVICE_PATH, device)
 
-            if not os.path.exists(device_dir):
+            if not self.sysfs.exists(device_dir):
                 continue
 
             device_info = {}
 
             bus_type = device_description = hid = None
 
-            for property_name in os.listdir(device_dir):
+            for property_name in self.sysfs.listdir(device_dir):
                 device_property_path = os.path.join(device_dir, property_name)
 
                 if "firmware_node" in property_name:
-                    for firmware_node_property in os.listdir(device_property_path):
+                    for firmware_node_property in self.sysfs.listdir(device_property_path):
                         firmware_node_property_path = os.path.join(device_property_path, firmware_node_property)
 
                         if "description" == firmware_node_property:
-                            device_description = self.format_value(self.utils.read_file(firmware_node_property_path))
+                            device_description = self.sysfs.read_text(firmware_node_property_path)
                         elif "hid" == firmware_node_property:
-                            hid = self.format_value(self.utils.read_file(firmware_node_property_path))
+                            hid = self.sysfs.read_text(firmware_node_property_path)
                 elif "modalias" == property_name:
-                    bus_type = self.format_value(self.utils.read_file(device_property_path).split(":")[0].upper())
+                    bus_type = self.sysfs.read_text(device_property_path).split(":")[0].upper()
 
             if not bus_type:
                 continue
@@ -1286,7 +1326,7 @@ class LinuxHardwareInfo:
 
             device_info.update(self.get_device_location_paths(device_dir))
 
-            system_device_info[self.utils.get_unique_key(device_description or hid or device.split(":")[0].split(".")[0], system_device_info)] = device_info
+            system_device_info[self.utils.get_unique_key(device_description or hid or device.split(":")[0].split(".")[0], system_device_info, key_counters)] = device_info
 
         for device_class in self.devices_by_class:
             if device_class in ("USB controller", "VGA compatible controller", "3D controller", "Non-Volatile memory controller", "SATA controller"):
@@ -1308,46 +1348,63 @@ class LinuxHardwareInfo:
                 if device.get("ACPI Path"):
                     device_info["ACPI Path"] = device.get("ACPI Path")
 
-                system_device_info[self.utils.get_unique_key(device_name, system_device_info)] = device_info
+                system_device_info[self.utils.get_unique_key(device_name, system_device_info, key_counters)] = device_info
 
         return system_device_info
 
-    def hardware_collector(self):
+    def hardware_collector(self, max_workers=None, pause=True):
         self.utils.head("Hardware Information Collection")
         print("")
         print("Please wait while we gather your hardware details")
         print("")
         self.result = {}
+        self.metrics.reset()
+        self.sysfs.reset()
+        self.device_locator.reset()
+        self.cpu_topology.reset()
+        self.usb_devices = None
+        self.usb_device_ids = None
+        self.lspci_devices = None
+        self.pci_bars = None
 
         steps = [
-            ('Gathering PCI devices', self.pci_devices, None),
-            ('Gathering motherboard information', self.motherboard, "Motherboard"),
-            ('Gathering BIOS information', self.bios, "BIOS"),
-            ('Gathering CPU information', self.cpu, "CPU"),
-            ('Gathering GPU information', self.gpu, "GPU"),
-            ('Gathering monitor information', self.monitor, "Monitor"),
-            ('Gathering network information', self.network, "Network"),
-            ('Gathering sound information', self.sound, "Sound"),
-            ('Gathering USB controllers', self.usb_controllers, "USB Controllers"),
-            ('Gathering input devices', self.input, "Input"),
-            ('Gathering storage controllers', self.storage_controllers, "Storage Controllers"),
-            ('Gathering biometric information', self.biometric, "Biometric"),
-            ('Gathering bluetooth information', self.bluetooth, "Bluetooth"),
-            ('Gathering sd controller information', self.sd_controller, "SD Controller"),
-            ('Gathering system devices', self.system_devices, "System Devices")
+            ('Gathering PCI devices', self.pci_devices, None, ()),
+            ('Gathering motherboard information', self.motherboard, "Motherboard", (self.pci_devices,)),
+            ('Gathering BIOS information', self.bios, "BIOS", ()),
+            ('Gathering CPU information', self.cpu, "CPU", ()),
+            ('Gathering GPU information', self.gpu, "GPU", ()),
+            ('Gathering monitor information', self.monitor, "Monitor", (self.gpu,)),
+            ('Gathering network information', self.network, "Network", ()),
+            ('Gathering sound information', self.sound, "Sound", (self.pci_devices,)),
+            ('Gathering USB controllers', self.usb_controllers, "USB Controllers", (self.pci_devices,)),
+            ('Gathering input devices', self.input, "Input", ()),
+            ('Gathering storage controllers', self.storage_controllers, "Storage Controllers", (self.pci_devices,)),
+            ('Gathering biometric information', self.biometric, "Biometric", ()),
+            ('Gathering bluetooth information', self.bluetooth, "Bluetooth", ()),
+            ('Gathering sd controller information', self.sd_controller, "SD Controller", ()),
+            ('Gathering system devices', self.system_devices, "System Devices", (self.pci_devices,))
         ]
 
         total_steps = len(steps)
-        for index, (message, function, attribute) in enumerate(steps, start=1):
-            print(f"[{index}/{total_steps}] {message}...")
-            value = function()
+
+        def on_start(index):
+            print(f"[{index + 1}/{total_steps}] {steps[index][0]}...")
+
+        def on_finish(index, value):
+            message, function, attribute, dependencies = steps[index]
             if not attribute:
-                continue
+                return
             if value:
+                # Stored before dependents start, monitor reads the GPU entry
                 self.result[attribute] = value
             else:
                 print("    - No {} found.".format(attribute.lower()))
 
+        self.metrics.run_steps(step_scheduler.StepScheduler(max_workers=max_workers), [(function, dependencies) for message, function, attribute, dependencies in steps], on_start, on_finish)
+
+        self.result = {attribute: self.result[attribute] for message, function, attribute, dependencies in steps if attribute in self.result}
+
         print("")
         print("Hardware information collection complete.")
-        time.sleep(1)
+        if pause:
+            time.sleep(1)
@@ -1,26 +1,41 @@
-from ..datasets import chipset_data
 from ..datasets import pci_data
+from .. import chipset_identifier
+from .. import collection_metrics
 from .. import cpu_identifier
 from .. import cpuid
 from .. import device_locator
 from .. import gpu_identifier
+from .. import ids_database
+from .. import step_scheduler
 from .. import utils
+import threading
 import time
 import re
 import wmi
 import winreg
 import subprocess
 
-c = wmi.WMI()
-
 class WindowsHardwareInfo:
     def __init__(self, rich_format=True):
         self.lookup_codename = cpu_identifier.CPUIdentifier().lookup_codename
         self.classify_gpu = gpu_identifier.GPUIdentifier().classify_gpu
+        self.chipset_identifier = chipset_identifier.ChipsetIdentifier()
         self.get_device_location_paths = device_locator.WindowsDeviceLocator().get_device_location_paths
+        self.metrics = collection_metrics.CollectionMetrics()
         self.utils = utils.Utils(rich_format=rich_format)
-        self.usb_ids = self.utils.read_file(self.utils.get_full_path("Scripts", "datasets", "usb.ids"))
-        self.pci_ids = self.utils.read_file(self.utils.get_full_path("Scripts", "datasets", "pci.ids"))
+        self.utils.metrics = self.metrics
+        self.usb_ids = ids_database.load(self.utils.get_full_path("Scripts", "datasets", "usb.ids"))
+        self.pci_ids = ids_database.load(self.utils.get_full_path("Scripts", "datasets", "pci.ids"))
+        self.wmi_connections = threading.local()
+
+    def get_wmi_connection(self):
+        # A WMI connection can only be used from the thread that opened it
+        connection = getattr(self.wmi_connections, "connection", None)
+
+        if connection is None:
+            connection = self.wmi_connections.connection = wmi.WMI()
+
+        return connection
 
     def parse_device_path(self, device_path):
         device_info = {}
@@ -93,7 +108,7 @@ class WindowsHardwareInfo:
         }
         self.chipset_model = "Unknown"
 
-        for device in c.Win32_PnPEntity():
+        for device in self.get_wmi_connection().Win32_PnPEntity():
             device_name = getattr(device, "Name", None) or "Unknown"
             device_class = getattr(device, "PNPClass", None) or "Unknown"
             pnp_device_id = getattr(device, "PNPDeviceID", None)
@@ -104,8 +119,8 @@ class WindowsHardwareInfo:
                 if device_info.get("Device ID"):
                     if device_class in "Unknown":
                         device_class = self.unknown_class_device(device_name, device_info.get("Device ID"))
-                    elif device_class in "System" and chipset_data.chipset_controllers.get(device_info.get("Device ID")):
-                        self.chipset_model = chipset_data.chipset_controllers.get(device_info.get("Device ID"))
+                    elif device_class in "System" and self.chipset_identifier.lookup_controller(device_info.get("Device ID")):
+                        self.chipset_model = self.chipset_identifier.lookup_controller(device_info.get("Device ID"))
 
             if device_class in self.devices_by_class:
                 self.devices_by_class[device_class].append(device)
@@ -113,12 +128,12 @@ class WindowsHardwareInfo:
     def motherboard(self):
         manufacturer = model = "Unknown"
 
-        for computer_system in c.Win32_ComputerSystem():
+        for computer_system in self.get_wmi_connection().Win32_ComputerSystem():
             if computer_system:
                 manufacturer = (getattr(computer_system, "Manufacturer", None) or "Unknown").split(" ")[0]
                 model = getattr(computer_system, "Model", None) or "Unknown"
 
-        for base_board in c.Win32_BaseBoard():
+        for base_board in self.get_wmi_connection().Win32_BaseBoard():
             if base_board:
                 base_board_manufacturer = (getattr(base_board, "Manufacturer", None) or "Unknown").split(" ")[0]
                 base_board_model = getattr(base_board, "Product", None) or "Unknown"
@@ -134,10 +149,7 @@ class WindowsHardwareInfo:
         else:
             system_name = " ".join(filter(lambda x: "unknown" not in x.lower(), [manufacturer, model])).upper()
 
-        for chipset_name in chipset_data.amd_chipsets:
-            if chipset_name in system_name:
-                self.chipset_model = chipset_name
-                break
+        self.chipset_model = self.chipset_identifier.lookup_system_chipset(system_name) or self.chipset_model
 
         system_platform = computer_system.PCSystemType
         
@@ -157,8 +169,8 @@ class WindowsHardwareInfo:
     def bios(self):
         bios_info = {}
 
-        bios = c.Win32_BIOS()[0]
-        for bios in c.Win32_BIOS():
+        bios = self.get_wmi_connection().Win32_BIOS()[0]
+        for bios in self.get_wmi_connection().Win32_BIOS():
             if bios:
                 bios_info["Version"] = getattr(bios, "SMBIOSBIOSVersion", None) or "Unknown"
                 try:
@@ -166,7 +178,7 @@ class WindowsHardwareInfo:
                 except:
                     bios_info["Release Date"] = "Unknown"
 
-        for computer_system in c.Win32_ComputerSystem():
+        for computer_system in self.get_wmi_connection().Win32_ComputerSystem():
             if computer_system:
                 bios_info["System Type"] = (getattr(computer_system, "SystemType", None) or "Unknown").split(" ")[0]
 
@@ -182,6 +194,7 @@ class WindowsHardwareInfo:
 
         if not bios_info.get("Firmware Type"):
             try:
+                self.metrics.record("Subprocesses")
                 result = subprocess.run(["powershell", "-Command", "$env:firmware_type"], capture_output=True, text=True)
                 bios_info["Firmware Type"] = result.stdout.strip() if result.returncode == 0 else bios_info["Firmware Type"]
             except Exception as e:
@@ -226,7 +239,7 @@ class WindowsHardwareInfo:
             "AVX2": (7, 0, 1, 5)
         }
 
-        cpu = cpuid.CPUID()
+        cpu = cpuid.get_cpuid()
         simd_feature_support = []
 
         for feature, address in simd_features_map.items():
@@ -236,7 +249,7 @@ class WindowsHardwareInfo:
         return ", ".join(simd_feature_support) if simd_feature_support else "SIMD Capabilities Unknown"
     
     def cpu(self):
-        cpus = c.Win32_Processor()
+        cpus = self.get_wmi_connection().Win32_Processor()
 
         for cpu in cpus:
             if cpu:
@@ -316,7 +329,7 @@ class WindowsHardwareInfo:
 
             if "Unknown" in (device_name, device_class):
                 try:
-                    device_name = self.pci_ids.get(device_info.get("Device ID")[:4]).get("devices")[device_info.get("Device ID")[5:]]
+                    device_name = self.pci_ids.get_device_name(device_info.get("Device ID")[:4], device_info.get("Device ID")[5:]) or device_name
                 except:
                     pass
             
@@ -568,7 +581,7 @@ class WindowsHardwareInfo:
 
             if not device_info.get("Bus Type") in ("ACPI"):
                 try:
-                    device_name = self.usb_ids.get(device_info.get("Device ID")[:4]).get("devices")[device_info.get("Device ID")[5:]]
+                    device_name = self.usb_ids.get_device_name(device_info.get("Device ID")[:4], device_info.get("Device ID")[5:]) or device_name
                 except:
                     pass
                 device_info["Bus Type"] = "USB"
@@ -609,7 +622,7 @@ class WindowsHardwareInfo:
                 continue
 
             try:
-                device_name = self.pci_ids.get(device_info.get("Device ID")[:4]).get("devices")[device_info.get("Device ID")[5:]]
+                device_name = self.pci_ids.get_device_name(device_info.get("Device ID")[:4], device_info.get("Device ID")[5:]) or device_name
             except:
                 pass
             
@@ -695,41 +708,57 @@ class WindowsHardwareInfo:
 
         return system_device_info
 
-    def hardware_collector(self):
+    def hardware_collector(self, pause=True):
         self.result = {}
+        self.metrics.reset()
 
         steps = [
-            ('Gathering PnP devices', self.pnp_devices, None),
-            ('Gathering motherboard information', self.motherboard, "Motherboard"),
-            ('Gathering BIOS information', self.bios, "BIOS"),
-            ('Gathering CPU information', self.cpu, "CPU"),
-            ('Gathering GPU information', self.gpu, "GPU"),
-            ('Gathering monitor information', self.monitor, "Monitor"),
-            ('Gathering network information', self.network, "Network"),
-            ('Gathering sound information', self.sound, "Sound"),
-            ('Gathering USB controllers', self.usb_controllers, "USB Controllers"),
-            ('Gathering input devices', self.input, "Input"),
-            ('Gathering storage controllers', self.storage_controllers, "Storage Controllers"),
-            ('Gathering biometric information', self.biometric, "Biometric"),
-            ('Gathering bluetooth information', self.bluetooth, "Bluetooth"),
-            ('Gathering sd controller information', self.sd_controller, "SD Controller"),
-            ('Gathering system devices', self.system_devices, "System Devices")
+            ('Gathering PnP devices', self.pnp_devices, None, ()),
+            ('Gathering motherboard information', self.motherboard, "Motherboard", (self.pnp_devices,)),
+            ('Gathering BIOS information', self.bios, "BIOS", ()),
+            ('Gathering CPU information', self.cpu, "CPU", ()),
+            ('Gathering GPU information', self.gpu, "GPU", (self.pnp_devices,)),
+            ('Gathering monitor information', self.monitor, "Monitor", (self.pnp_devices, self.gpu)),
+            ('Gathering network information', self.network, "Network", (self.pnp_devices,)),
+            ('Gathering sound information', self.sound, "Sound", (self.pnp_devices,)),
+            ('Gathering USB controllers', self.usb_controllers, "USB Controllers", (self.pnp_devices,)),
+            ('Gathering input devices', self.input, "Input", (self.pnp_devices,)),
+            ('Gathering storage controllers', self.storage_controllers, "Storage Controllers", (self.pnp_devices,)),
+            ('Gathering biometric information', self.biometric, "Biometric", (self.pnp_devices,)),
+            ('Gathering bluetooth information', self.bluetooth, "Bluetooth", (self.pnp_devices,)),
+            ('Gathering sd controller information', self.sd_controller, "SD Controller", (self.pnp_devices,)),
+            ('Gathering system devices', self.system_devices, "System Devices", (self.pnp_devices,))
         ]
 
         title = "Collecting hardware information"
-        step_names = [message for message, function, attribute in steps]
+        step_names = [message for message, function, attribute, dependencies in steps]
+        finished_steps = set()
+        running_steps = set()
 
-        for index, (message, function, attribute) in enumerate(steps):
-            self.utils.progress_bar(title, step_names, index)
-            value = function()
+        def on_start(index):
+            running_steps.add(index)
+            self.utils.progress_bar(title, step_names, finished_steps=finished_steps, running_steps=running_steps)
+
+        def on_finish(index, value):
+            running_steps.discard(index)
+            finished_steps.add(index)
+            self.utils.progress_bar(title, step_names, finished_steps=finished_steps, running_steps=running_steps)
+
+            message, function, attribute, dependencies = steps[index]
             if not attribute:
-                continue
+                return
             if value:
                 self.result[attribute] = value
             else:
                 print("    - No {} found.".format(attribute.lower()))
 
+        # The PnP objects are shared between steps and stay bound to the thread that created them, so the steps run one at a time here
+        self.metrics.run_steps(step_scheduler.StepScheduler(max_workers=1), [(function, dependencies) for message, function, attribute, dependencies in steps], on_start, on_finish)
+
+        self.result = {attribute: self.result[attribute] for message, function, attribute, dependencies in steps if attribute in self.result}
+
         self.utils.progress_bar(title, step_names, len(steps), done=True)
 
         print("Hardware information collection complete!")
-        time.sleep(1)
\ No newline at end of file
+        if pause:
+            time.sleep(1)
\ No newline at end of file
@@ -0,0 +1,95 @@
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+import os
+
+class StepScheduler:
+    def __init__(self, max_workers=None):
+        if max_workers is None:
+            max_workers = min(8, (os.cpu_count() or 1) + 4)
+
+        self.max_workers = max_workers
+
+    def build_graph(self, steps):
+        step_indexes = {}
+        for index, (function, dependencies) in enumerate(steps):
+            step_indexes[function] = index
+
+        remaining_dependencies = []
+        dependents = [[] for _ in steps]
+
+        for index, (function, dependencies) in enumerate(steps):
+            dependency_indexes = set()
+
+            for dependency in dependencies or ():
+                if dependency not in step_indexes:
+                    raise ValueError("Step {} depends on an unknown step {}".format(getattr(function, "__name__", function), getattr(dependency, "__name__", dependency)))
+
+                dependency_indexes.add(step_indexes[dependency])
+
+            for dependency_index in dependency_indexes:
+                dependents[dependency_index].append(index)
+
+            remaining_dependencies.append(len(dependency_indexes))
+
+        return remaining_dependencies, dependents
+
+    def run(self, steps, on_start=None, on_finish=None):
+        # Callbacks always run on the calling thread; values come back in declared order
+        remaining_dependencies, dependents = self.build_graph(steps)
+        ready = [index for index, count in enumerate(remaining_dependencies) if count == 0]
+        values = [None] * len(steps)
+        finished_steps = 0
+
+        def finish(index, value):
+            values[index] = value
+
+            if on_finish:
+                on_finish(index, value)
+
+            for dependent_index in dependents[index]:
+                remaining_dependencies[dependent_index] -= 1
+                if remaining_dependencies[dependent_index] == 0:
+                    ready.append(dependent_index)
+
+        if self.max_workers <= 1:
+            while ready:
+                ready.sort()
+                index = ready.pop(0)
+
+                if on_start:
+                    on_start(index)
+
+                finish(index, steps[index][0]())
+                finished_steps += 1
+        else:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                running = {}
+
+                while ready or running:
+                    ready.sort()
+                    while ready:
+                        index = ready.pop(0)
+
+                        if on_start:
+                            on_start(index)
+
+                        running[executor.submit(steps[index][0])] = index
+
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+
+                    for future in sorted(done, key=lambda future: running[future]):
+                        index = running.pop(future)
+
+                        try:
+                            value = future.result()
+                        except:
+                            for pending_future in running:
+                                pending_future.cancel()
+                            raise
+
+                        finish(index, value)
+                        finished_steps += 1
+
+        if finished_steps != len(steps):
+            raise ValueError("Circular dependency between collection steps")
+
+        return values
@@ -0,0 +1,244 @@
+import os
+import threading
+
+READ_SIZE = 65536
+MAX_SYMLINKS = 40
+
+def parse_cpu_list(value):
+    # Kernel CPU lists look like "0-3,8-11"
+    if not value:
+        return None
+
+    cpus = []
+
+    try:
+        for cpu_range in value.split(","):
+            first, separator, last = cpu_range.partition("-")
+            cpus.extend(range(int(first), int(last if separator else first) + 1))
+    except ValueError:
+        return None
+
+    return cpus
+
+class SysfsSnapshot:
+    def __init__(self, root=None, metrics=None):
+        # Paths stay /sys and /proc everywhere else, the root only decides where they are read from
+        self.root = os.path.abspath(root).rstrip("/") if root else ""
+        self.metrics = metrics
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.attributes = {}
+            self.directories = {}
+            self.uevents = {}
+
+    def get_host_path(self, path):
+        if not self.root:
+            return path
+
+        return self.root + self.realpath(path)
+
+    def resolve_link(self, path):
+        if not self.root:
+            return os.path.realpath(path)
+
+        pending_parts = [part for part in path.split("/") if part]
+        resolved_path = ""
+        followed_links = 0
+
+        while pending_parts:
+            part = pending_parts.pop(0)
+
+            if part == ".":
+                continue
+            if part == "..":
+                resolved_path = os.path.dirname(resolved_path)
+                continue
+
+            candidate_path = resolved_path + "/" + part
+
+            try:
+                target = os.readlink(self.root + candidate_path)
+            except OSError:
+                resolved_path = candidate_path
+                continue
+
+            followed_links += 1
+            if followed_links > MAX_SYMLINKS:
+                return candidate_path
+
+            # Absolute targets in a captured tree point inside the root, not at the host
+            if target.startswith("/"):
+                resolved_path = ""
+
+            pending_parts = [part for part in target.split("/") if part] + pending_parts
+
+        return resolved_path or "/"
+
+    def realpath(self, path):
+        if not path.startswith("/"):
+            path = os.path.join("/", path)
+
+        real_path = self.directories.get(path)
+        if real_path is None:
+            real_path = self.directories[path] = self.resolve_child(path)
+
+        return real_path
+
+    def resolve_child(self, path):
+        # Sibling paths share their parent, so only the last component needs a readlink
+        parent_path, separator, name = path.rstrip("/").rpartition("/")
+
+        if not name or name in (".", ".."):
+            return self.resolve_link(path)
+
+        parent_path = self.realpath(parent_path or "/")
+        candidate_path = (parent_path if parent_path != "/" else "") + "/" + name
+
+        try:
+            os.readlink(self.root + candidate_path)
+        except OSError:
+            return candidate_path
+
+        return self.resolve_link(candidate_path)
+
+    def resolve_path(self, path):
+        directory, separator, name = path.rpartition("/")
+        directory = self.realpath(directory or "/")
+
+        return (directory if directory != "/" else "") + "/" + name
+
+    def exists(self, path):
+        return os.path.exists(self.get_host_path(path))
+
+    def isdir(self, path):
+        return os.path.isdir(self.get_host_path(path))
+
+    def islink(self, path):
+        return os.path.islink(self.root + self.resolve_path(path))
+
+    def readlink(self, path):
+        return os.readlink(self.root + self.resolve_path(path))
+
+    def listdir(self, path):
+        if self.metrics:
+            self.metrics.record("Directories Listed")
+
+        return os.listdir(self.get_host_path(path))
+
+    def read_attribute(self, resolved_path):
+        try:
+            file_descriptor = os.open(self.root + resolved_path, os.O_RDONLY)
+        except OSError:
+            return None
+
+        try:
+            chunks = []
+
+            while True:
+                chunk = os.read(file_descriptor, READ_SIZE)
+                if not chunk:
+                    break
+
+                # Binary attributes like edid come back at most a page per read, only an empty read marks the end
+                chunks.append(chunk)
+        except OSError:
+            return None
+        finally:
+            os.close(file_descriptor)
+
+        value = b"".join(chunks)
+
+        if self.metrics:
+            self.metrics.record("Files Read")
+            self.metrics.record("Bytes Read", len(value))
+
+        return value
+
+    def read_first_block(self, path, separator=b"\n\n"):
+        # Large procfs files like cpuinfo repeat one block per CPU, stop reading after the first
+        try:
+            file_descriptor = os.open(self.root + self.resolve_path(path), os.O_RDONLY)
+        except OSError:
+            return None
+
+        try:
+            content = b""
+
+            while separator not in content:
+                chunk = os.read(file_descriptor, READ_SIZE)
+                if not chunk:
+                    break
+
+                content += chunk
+        except OSError:
+            return None
+        finally:
+            os.close(file_descriptor)
+
+        if self.metrics:
+            self.metrics.record("Files Read")
+            self.metrics.record("Bytes Read", len(content))
+
+        return content.split(separator)[0].decode("utf-8", errors="replace")
+
+    def read_bytes(self, path):
+        resolved_path = self.resolve_path(path)
+
+        # The lock only guards the cache, reads from parallel steps overlap
+        with self.lock:
+            cached = resolved_path in self.attributes
+            value = self.attributes.get(resolved_path)
+
+        if self.metrics:
+            self.metrics.record("Cache Hits" if cached else "Cache Misses")
+
+        if cached:
+            return value
+
+        value = self.read_attribute(resolved_path)
+
+        with self.lock:
+            return self.attributes.setdefault(resolved_path, value)
+
+    def read_text(self, path):
+        value = self.read_bytes(path)
+
+        if value is None:
+            return None
+
+        return value.decode("utf-8", errors="replace").strip() or None
+
+    def read_hex(self, path):
+        try:
+            return int(self.read_text(path), 16)
+        except (TypeError, ValueError):
+            return None
+
+    def read_int(self, path):
+        try:
+            return int(self.read_text(path))
+        except (TypeError, ValueError):
+            return None
+
+    def read_cpu_list(self, path):
+        return parse_cpu_list(self.read_text(path))
+
+    def read_uevent(self, device_dir):
+        uevent_path = os.path.join(device_dir, "uevent")
+        resolved_path = self.resolve_path(uevent_path)
+
+        if resolved_path in self.uevents:
+            return self.uevents[resolved_path]
+
+        uevent = {}
+
+        for line in (self.read_text(uevent_path) or "").splitlines():
+            key, separator, value = line.partition("=")
+            if separator:
+                uevent[key] = value
+
+        self.uevents[resolved_path] = uevent
+        return uevent
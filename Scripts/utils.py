@@ -1,3 +1,5 @@
+from Scripts import ids_database
+import fnmatch
 import os
 import sys
 import json
@@ -9,6 +11,8 @@ class Utils:
     def __init__(self, script_name = "Hardware Sniffer", rich_format=True):
         self.rich_format = rich_format
         self.script_name = script_name
+        self.virtual_terminal = None
+        self.metrics = None
     
     def get_full_path(self, *path):
         if getattr(sys, 'frozen', False):
@@ -42,24 +46,7 @@ class Utils:
             elif file_extension == ".json":
                 data = json.load(file_handle)
             elif file_extension == ".ids":
-                data = {}
-                current_vendor = None
-                
-                for line in file_handle.read().decode().splitlines():
-                    if not line.strip() or line.startswith("#"):
-                        continue
-                    
-                    if not line.startswith("\t"):
-                        parts = line.split(maxsplit=1)
-                        if len(parts) == 2:
-                            current_vendor = parts[0].upper()
-                            data[current_vendor] = {"name": parts[1], "devices": {}}
-                    
-                    elif current_vendor:
-                        parts = line.strip().split(maxsplit=1)
-                        if len(parts) == 2:
-                            device_id, device_name = parts
-                            data[current_vendor]["devices"][device_id.upper()] = device_name
+                data = ids_database.LazyIdsDatabase(file_path)
             else:
                 data = file_handle.read()
 
@@ -70,7 +57,7 @@ class Utils:
                         pass
         return data
 
-    def find_matching_paths(self, root_path, extension_filter=None, name_filter=None, type_filter=None):
+    def find_matching_paths(self, root_path, extension_filter=None, name_filter=None, type_filter=None, pattern=None, max_depth=None, skip_dirs=()):
 
         def is_valid_item(name):
             if name.startswith("."):
@@ -79,24 +66,40 @@ class Utils:
                 return False
             if name_filter and name_filter not in name:
                 return False
+            if pattern and not fnmatch.fnmatchcase(name, pattern):
+                return False
             return True
-        
-        found_paths = []
 
-        for root, dirs, files in os.walk(root_path):
-            relative_root = root.replace(root_path, "")[1:]
+        def scan(relative_root, depth):
+            if self.metrics:
+                self.metrics.record("Directories Listed")
+
+            try:
+                with os.scandir(os.path.join(root_path, relative_root)) as iterator:
+                    entries = sorted(iterator, key=lambda entry: entry.name)
+            except OSError:
+                return
+
+            for entry in entries:
+                relative_path = os.path.join(relative_root, entry.name)
+
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
 
-            if type_filter in (None, "dir"):
-                for d in dirs:
-                    if is_valid_item(d):
-                        found_paths.append((os.path.join(relative_root, d), "dir"))
+                if is_valid_item(entry.name) and type_filter in (None, "dir" if is_dir else "file"):
+                    yield (relative_path, "dir" if is_dir else "file")
 
-            if type_filter in (None, "file"):
-                for file in files:
-                    if is_valid_item(file):
-                        found_paths.append((os.path.join(relative_root, file), "file"))
+                if not is_dir or entry.is_symlink() or (max_depth and depth >= max_depth):
+                    continue
 
-        return sorted(found_paths, key=lambda path: path[0])
+                if any(fnmatch.fnmatchcase(entry.name, skip_dir) for skip_dir in skip_dirs):
+                    continue
+
+                yield from scan(relative_path, depth + 1)
+
+        return scan("", 1)
  
     def create_folder(self, path, remove_content=False):
         if os.path.exists(path):
@@ -106,17 +109,21 @@ class Utils:
         else:
             os.makedirs(path)
     
-    def get_unique_key(self, base_key, dictionary):
+    def get_unique_key(self, base_key, dictionary, counters=None):
         if base_key not in dictionary:
             return base_key
         
-        counter = 1
+        # Callers that only ever add keys can pass counters, so each name resumes where its last probe stopped
+        counter = counters.get(base_key, 1) if counters is not None else 1
         unique_key = f"{base_key}_#{counter}"
         
         while unique_key in dictionary:
             counter += 1
             unique_key = f"{base_key}_#{counter}"
         
+        if counters is not None:
+            counters[base_key] = counter + 1
+
         return unique_key
         
     def extract_zip_file(self, zip_path, extraction_directory=None):
@@ -142,17 +149,22 @@ class Utils:
         
         return user_response
 
-    def progress_bar(self, title, steps, current_step_index, done=False):
+    def progress_bar(self, title, steps, current_step_index=None, done=False, finished_steps=None, running_steps=None):
         self.head(title)
         print("")
         if done:
             for step in steps:
                 print("  [{}] {}".format("\033[92m✓\033[0m" if self.rich_format else "*", step))
         else:
+            # Steps that run concurrently pass which ones finished and which are running instead of a single index
+            if finished_steps is None:
+                finished_steps = range(current_step_index)
+                running_steps = (current_step_index,)
+
             for i, step in enumerate(steps):
-                if i < current_step_index:
+                if i in finished_steps:
                     print("  [{}] {}".format("\033[92m✓\033[0m" if self.rich_format else "*", step))
-                elif i == current_step_index:
+                elif i in (running_steps or ()):
                     print("  [{}] {}".format("\033[1;93m>\033[0m" if self.rich_format else ">", step))
                 else:
                     print("  [ ] {}".format(step))
@@ -162,7 +174,7 @@ class Utils:
         if text == None:
             text = self.script_name
         
-        os.system('cls' if os.name=='nt' else 'clear')
+        self.clear_screen()
 
         if self.rich_format:
             if resize:
@@ -177,7 +189,47 @@ class Utils:
         else:
             print(text)
     
+    def is_interactive(self):
+        try:
+            return sys.stdout.isatty()
+        except (AttributeError, ValueError):
+            return False
+
+    def enable_virtual_terminal(self):
+        if self.virtual_terminal is None:
+            self.virtual_terminal = os.name != "nt"
+
+            if os.name == "nt":
+                try:
+                    import ctypes
+
+                    kernel32 = ctypes.windll.kernel32
+                    console_handle = kernel32.GetStdHandle(-11)
+                    console_mode = ctypes.c_uint32()
+
+                    if kernel32.GetConsoleMode(console_handle, ctypes.byref(console_mode)):
+                        # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+                        self.virtual_terminal = bool(kernel32.SetConsoleMode(console_handle, console_mode.value | 0x0004))
+                except Exception:
+                    self.virtual_terminal = False
+
+        return self.virtual_terminal
+
+    def clear_screen(self):
+        if not self.is_interactive():
+            return
+
+        if not self.enable_virtual_terminal():
+            os.system("cls")
+            return
+
+        sys.stdout.write("\033[H\033[2J\033[3J")
+        sys.stdout.flush()
+
     def adjust_window_size(self, content=""):
+        if not self.is_interactive() or not self.enable_virtual_terminal():
+            return
+
         lines = content.splitlines()
         rows = len(lines)
         cols = max(len(line) for line in lines) if lines else 0
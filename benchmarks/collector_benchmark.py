@@ -0,0 +1,137 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from Scripts.platforms.linux import LinuxHardwareInfo
+from Scripts import collection_metrics
+from sysfs_generator import SyntheticSysfs
+import argparse
+import contextlib
+import io
+import json
+import shutil
+import tempfile
+import time
+
+FIELDS = ("Wall Time (ms)", "CPU Time (ms)") + collection_metrics.COUNTERS
+
+# Below this a step is too fast for its growth to mean anything
+NOISE_FLOOR_MS = 5
+
+class CollectorBenchmark:
+    def __init__(self, sizes, repeat=1, max_growth=2.0, keep_trees=False, workers=1):
+        self.sizes = sizes
+        self.workers = workers
+        self.repeat = repeat
+        self.max_growth = max_growth
+        self.keep_trees = keep_trees
+
+    def measure(self, tree_root):
+        best = None
+
+        for _ in range(self.repeat):
+            hardware_info = LinuxHardwareInfo(rich_format=False, sysfs_root=tree_root)
+
+            # Lazy caches are charged to whichever step fills them first, running serially keeps that stable
+            with contextlib.redirect_stdout(io.StringIO()):
+                hardware_info.hardware_collector(max_workers=self.workers, pause=False)
+
+            metrics = hardware_info.metrics.get_statistics()
+
+            if best is None or metrics["Total"]["Wall Time (ms)"] < best["Total"]["Wall Time (ms)"]:
+                best = metrics
+
+        return best
+
+    def run(self):
+        results = {}
+
+        for size in self.sizes:
+            tree_root = tempfile.mkdtemp(prefix="sysfs-{}-".format(size))
+
+            try:
+                start_time = time.perf_counter()
+                devices = SyntheticSysfs(tree_root, size).generate()
+                print("Generated {} devices in {:.2f}s at {}".format(size, time.perf_counter() - start_time, tree_root), file=sys.stderr)
+
+                results[size] = {
+                    "Devices": devices,
+                    "Steps": self.measure(tree_root)
+                }
+            finally:
+                if not self.keep_trees:
+                    shutil.rmtree(tree_root, ignore_errors=True)
+
+        return results
+
+    def find_regressions(self, results):
+        regressions = []
+        sizes = sorted(results)
+
+        for smaller, larger in zip(sizes, sizes[1:]):
+            device_growth = larger / smaller
+
+            for name, metrics in results[larger]["Steps"].items():
+                previous = results[smaller]["Steps"].get(name)
+                if not previous:
+                    continue
+
+                for field in FIELDS:
+                    timed = field.endswith("(ms)")
+                    if timed and metrics[field] < NOISE_FLOOR_MS:
+                        continue
+
+                    growth = metrics[field] / max(previous[field], NOISE_FLOOR_MS if timed else 1)
+                    if growth > device_growth * self.max_growth:
+                        regressions.append((name, field, smaller, larger, growth, device_growth))
+
+        return regressions
+
+    def print_report(self, results):
+        sizes = sorted(results)
+        step_names = list(results[sizes[-1]]["Steps"])
+
+        for field in FIELDS:
+            print("")
+            print(field)
+            print("  {:<22}".format("Step") + "".join("{:>12}".format(size) for size in sizes))
+
+            for name in step_names:
+                print("  {:<22}".format(name) + "".join("{:>12}".format(results[size]["Steps"].get(name, {}).get(field, 0)) for size in sizes))
+
+        regressions = self.find_regressions(results)
+
+        print("")
+        if not regressions:
+            print("No super-linear growth found.")
+        for name, field, smaller, larger, growth, device_growth in regressions:
+            print("Super-linear {} in {}: x{:.1f} from {} to {} devices (x{:.0f} devices)".format(field, name, growth, smaller, larger, device_growth))
+
+        return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Scaling benchmark for the Linux hardware collectors on synthetic sysfs trees")
+    parser.add_argument("--sizes", default="10,100,1000,10000", help="comma separated device counts (default: 10,100,1000,10000)")
+    parser.add_argument("--repeat", type=int, default=1, help="runs per size, the fastest is kept")
+    parser.add_argument("--max-growth", type=float, default=2.0, help="allowed growth relative to the device count before a step is flagged")
+    parser.add_argument("--workers", type=int, default=1, help="collection threads, 1 runs the steps serially (default: 1)")
+    parser.add_argument("--keep-trees", action="store_true", help="keep the generated trees")
+    parser.add_argument("--json", help="also write the results to this file")
+    parser.add_argument("--check", action="store_true", help="exit with a non-zero status on super-linear growth")
+    args = parser.parse_args()
+
+    benchmark = CollectorBenchmark([int(size) for size in args.sizes.split(",")], args.repeat, args.max_growth, args.keep_trees, args.workers)
+    results = benchmark.run()
+    regressions = benchmark.print_report(results)
+
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(results, file, indent=4)
+
+    if args.check and regressions:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
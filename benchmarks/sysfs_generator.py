@@ -0,0 +1,486 @@
+import os
+import random
+import struct
+
+HDA_CODECS = (
+    ("Realtek", "ALC256", "0x10ec0256"),
+    ("Realtek", "ALC897", "0x10ec0897"),
+    ("Intel", "Alderlake HDMI", "0x80862818"),
+    ("Conexant", "SN6140", "0x14f11f86")
+)
+
+USB_PRODUCTS = (
+    ("046d", "c52b", "Logitech", "USB Receiver", "00", (("03", "01", "02", "usbhid"),)),
+    ("0bda", "4014", "Generic", "USB Audio", "00", (("01", "01", "00", "snd-usb-audio"), ("01", "02", "00", "snd-usb-audio"))),
+    ("8087", "0033", None, None, "e0", (("e0", "01", "01", "btusb"), ("e0", "01", "01", "btusb"))),
+    ("06cb", "00f9", "Synaptics", "Fingerprint Sensor", "ff", (("ff", "10", "ff", "fprint"),)),
+    ("0781", "5583", "SanDisk", "Ultra Fit", "00", (("08", "06", "50", "usb-storage"),)),
+    ("05ac", "024f", "Apple Inc.", "Keyboard", "00", (("03", "01", "01", "usbhid"), ("03", "00", "00", "usbhid")))
+)
+
+PCI_ENDPOINTS = {
+    "network": ("8086", "15f3", "020000", "igc"),
+    "wireless": ("8086", "2725", "028000", "iwlwifi"),
+    "nvme": ("144d", "a808", "010802", "nvme"),
+    "sata": ("8086", "7ae2", "010601", "ahci"),
+    "gpu": ("10de", "2684", "030000", "nvidia"),
+    "hda": ("8086", "7ad0", "040300", "snd_hda_intel"),
+    "xhci": ("8086", "7ae0", "0c0330", "xhci_hcd"),
+    "isa": ("8086", "7a84", "060100", None),
+    "misc": ("8086", "7aa3", "0c0500", "i801_smbus"),
+    "bridge": ("8086", "7ab8", "060400", "pcieport")
+}
+
+class SyntheticSysfs:
+    def __init__(self, root, device_count, seed=0):
+        self.root = root
+        self.device_count = max(device_count, 10)
+        self.random = random.Random(seed)
+        self.counts = {}
+
+        self.domain = 0
+        self.next_bus = 1
+        self.root_port_index = 0
+        self.bus_slots = {}
+        self.acpi_index = 0
+
+    def path(self, *parts):
+        return os.path.join(self.root, *[part.lstrip("/") for part in parts])
+
+    def write(self, path, content):
+        path = self.path(path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        with open(path, "wb" if isinstance(content, bytes) else "w") as file:
+            file.write(content)
+
+    def link(self, path, target):
+        # Relative links, the way the kernel exposes them
+        path = self.path(path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.symlink(os.path.relpath(self.path(target), os.path.dirname(path)), path)
+
+    def count(self, name, amount=1):
+        self.counts[name] = self.counts.get(name, 0) + amount
+
+    def generate(self):
+        device_count = self.device_count
+
+        self.generate_firmware()
+        self.generate_cpus(min(max(device_count // 20, 2), 512))
+
+        self.root_bus_dir = self.add_root_bus()
+        self.add_pci_function("isa", bus_dir=self.root_bus_dir, slot=(0x1f, 0))
+
+        for index in range(max(1, device_count // 500)):
+            self.add_gpu(index)
+        for index in range(max(1, device_count // 1000)):
+            self.add_hda(index)
+        for index in range(max(1, device_count // 200)):
+            self.add_nvme(index)
+
+        self.add_pci_function("sata")
+
+        network_count = max(1, device_count // 50)
+        for index in range(network_count):
+            self.add_network(index, virtual_functions=4 if device_count >= 100 else 0)
+        self.add_pci_function("wireless")
+
+        usb_device_count = max(3, device_count // 10)
+        controller_count = max(1, device_count // 200)
+        for index in range(controller_count):
+            self.add_usb_controller(index, usb_device_count // controller_count + (1 if index < usb_device_count % controller_count else 0))
+
+        for index in range(max(2, device_count // 20)):
+            self.add_input(index)
+        for index in range(max(2, device_count // 50)):
+            self.add_platform_device(index)
+
+        while self.counts.get("PCI Functions", 0) < device_count * 2 // 5:
+            self.add_pci_function("misc")
+
+        self.write("/sys/class/net/lo/uevent", "INTERFACE=lo\nIFINDEX=1\n")
+
+        return self.counts
+
+    def generate_firmware(self):
+        dmi = {
+            "sys_vendor": "Synthetic Systems Inc.",
+            "product_name": "Benchmark Server",
+            "board_vendor": "Synthetic Systems Inc.",
+            "board_name": "SYN-Z790",
+            "chassis_type": "17",
+            "bios_version": "1.0.0",
+            "bios_date": "01/01/2024"
+        }
+
+        for name, value in dmi.items():
+            self.write("/sys/class/dmi/id/" + name, value + "\n")
+
+        self.write("/sys/firmware/efi/efivars/SecureBoot-8be4df61-93ca-11d2-aa0d-00e098032b8c", b"\x06\x00\x00\x00\x01")
+
+        for table in ("DSDT", "FACP", "APIC", "MCFG"):
+            self.write("/sys/firmware/acpi/tables/" + table, table.encode() + bytes(32))
+        self.write("/sys/firmware/acpi/tables/dynamic/SSDT1", b"SSDT" + bytes(32))
+
+    def generate_cpus(self, cpu_count):
+        packages = 2 if cpu_count >= 64 else 1
+        threads_per_core = 2 if cpu_count >= 4 else 1
+        cores_per_package = max(cpu_count // (packages * threads_per_core), 1)
+        cpu_count = packages * cores_per_package * threads_per_core
+        flags = "fpu vme de pse tsc msr pae mce cx8 apic sep mtrr pge mca cmov pat pse36 clflush mmx fxsr sse sse2 ss ht syscall nx pdpe1gb rdtscp lm constant_tsc pni pclmulqdq ssse3 fma cx16 sse4_1 sse4_2 x2apic movbe popcnt aes xsave avx f16c rdrand avx2 bmi1 bmi2"
+
+        cpuinfo = []
+        topology = []
+
+        for cpu in range(cpu_count):
+            thread = cpu // (packages * cores_per_package)
+            core_index = cpu % (packages * cores_per_package)
+            package = core_index // cores_per_package
+            core = core_index % cores_per_package
+            topology.append((cpu, package, core, thread))
+
+            cpuinfo.append("\n".join((
+                "processor\t: {}".format(cpu),
+                "vendor_id\t: GenuineIntel",
+                "cpu family\t: 6",
+                "model\t\t: 183",
+                "model name\t: 13th Gen Intel(R) Core(TM) i9-13900K",
+                "stepping\t: 1",
+                "physical id\t: {}".format(package),
+                "siblings\t: {}".format(cores_per_package * threads_per_core),
+                "core id\t\t: {}".format(core),
+                "cpu cores\t: {}".format(cores_per_package),
+                "flags\t\t: {}".format(flags)
+            )))
+
+        self.write("/proc/cpuinfo", "\n\n".join(cpuinfo) + "\n\n")
+
+        cpu_range = "0-{}".format(cpu_count - 1) if cpu_count > 1 else "0"
+        for name in ("present", "online", "possible"):
+            self.write("/sys/devices/system/cpu/" + name, cpu_range + "\n")
+        self.write("/sys/devices/cpu/type", "4\n")
+        self.write("/sys/devices/system/cpu/smt/active", "1\n" if threads_per_core > 1 else "0\n")
+
+        core_cpus = {}
+        package_cpus = {}
+        for cpu, package, core, thread in topology:
+            core_cpus.setdefault((package, core), []).append(cpu)
+            package_cpus.setdefault(package, []).append(cpu)
+
+        for cpu, package, core, thread in topology:
+            topology_dir = "/sys/devices/system/cpu/cpu{}/topology/".format(cpu)
+
+            self.write(topology_dir + "physical_package_id", "{}\n".format(package))
+            self.write(topology_dir + "die_id", "0\n")
+            self.write(topology_dir + "core_id", "{}\n".format(core))
+            self.write(topology_dir + "core_cpus_list", self.format_cpu_list(core_cpus[(package, core)]))
+            self.write(topology_dir + "thread_siblings_list", self.format_cpu_list(core_cpus[(package, core)]))
+            self.write(topology_dir + "die_cpus_list", self.format_cpu_list(package_cpus[package]))
+            self.write(topology_dir + "package_cpus_list", self.format_cpu_list(package_cpus[package]))
+            self.write("/sys/devices/system/cpu/cpu{}/cpu_capacity".format(cpu), "1024\n")
+
+        for package in range(packages):
+            self.write("/sys/devices/system/node/node{}/cpulist".format(package), self.format_cpu_list(package_cpus[package]))
+
+        self.count("CPUs", cpu_count)
+
+    def format_cpu_list(self, cpus):
+        # Ranges, the way the kernel prints CPU masks
+        ranges = []
+
+        for cpu in sorted(cpus):
+            if ranges and ranges[-1][1] == cpu - 1:
+                ranges[-1][1] = cpu
+            else:
+                ranges.append([cpu, cpu])
+
+        return ",".join(str(first) if first == last else "{}-{}".format(first, last) for first, last in ranges) + "\n"
+
+    def add_acpi_node(self, acpi_path, hid=None, description=None):
+        node_dir = "/sys/devices/LNXSYSTM:00/LNXSYBUS:00/device:{:02x}".format(self.acpi_index)
+        self.acpi_index += 1
+
+        self.write(node_dir + "/path", acpi_path + "\n")
+        if hid:
+            self.write(node_dir + "/hid", hid + "\n")
+        if description:
+            self.write(node_dir + "/description", description + "\n")
+
+        return node_dir
+
+    def add_root_bus(self):
+        bus_dir = "/sys/devices/pci{:04x}:00".format(self.domain)
+        os.makedirs(self.path(bus_dir), exist_ok=True)
+        self.bus_slots[bus_dir] = (self.domain, 0, [(device, function) for device in range(1, 32) for function in range(8) if device != 0x1f])
+        return bus_dir
+
+    def add_bridge(self, parent_bus_dir):
+        if self.next_bus > 0xff:
+            self.domain += 1
+            self.next_bus = 1
+            self.root_bus_dir = parent_bus_dir = self.add_root_bus()
+
+        bus_number = self.next_bus
+        self.next_bus += 1
+
+        bridge_dir = self.add_pci_function("bridge", bus_dir=parent_bus_dir)
+        self.bus_slots[bridge_dir] = (self.bus_slots[parent_bus_dir][0], bus_number, [(device, function) for device in range(32) for function in range(8)])
+        return bridge_dir
+
+    def allocate_slot(self, bus_dir=None, slot=None):
+        if bus_dir is None:
+            bus_dir = next((candidate for candidate, (_, bus_number, free_slots) in reversed(list(self.bus_slots.items())) if bus_number and free_slots), None)
+
+            if bus_dir is None:
+                # Every other root port fans out through a switch, to get some depth into the tree
+                bus_dir = self.add_bridge(self.root_bus_dir)
+                if self.root_port_index % 2:
+                    bus_dir = self.add_bridge(bus_dir)
+                self.root_port_index += 1
+
+        domain, bus_number, free_slots = self.bus_slots[bus_dir]
+
+        if slot:
+            free_slots.remove(slot) if slot in free_slots else None
+        else:
+            if not free_slots:
+                return self.allocate_slot()
+            slot = free_slots.pop(0)
+
+        return bus_dir, "{:04x}:{:02x}:{:02x}.{}".format(domain, bus_number, slot[0], slot[1])
+
+    def add_pci_function(self, kind, bus_dir=None, slot=None, virtual_function=False):
+        bus_dir, slot_name = self.allocate_slot(bus_dir, slot)
+        vendor_id, device_id, class_code, driver = PCI_ENDPOINTS[kind]
+        subsystem_vendor_id, subsystem_device_id = vendor_id, "{:04x}".format(self.random.randrange(0x1000, 0xffff))
+
+        function_dir = bus_dir + "/" + slot_name
+
+        self.write(function_dir + "/vendor", "0x{}\n".format(vendor_id))
+        self.write(function_dir + "/device", "0x{}\n".format(device_id))
+        self.write(function_dir + "/class", "0x{}\n".format(class_code))
+        self.write(function_dir + "/subsystem_vendor", "0x{}\n".format(subsystem_vendor_id))
+        self.write(function_dir + "/subsystem_device", "0x{}\n".format(subsystem_device_id))
+        self.write(function_dir + "/uevent", "".join((
+            "DRIVER={}\n".format(driver) if driver else "",
+            "PCI_CLASS={}\n".format(class_code.upper().lstrip("0") or "0"),
+            "PCI_ID={}:{}\n".format(vendor_id.upper(), device_id.upper()),
+            "PCI_SUBSYS_ID={}:{}\n".format(subsystem_vendor_id.upper(), subsystem_device_id.upper()),
+            "PCI_SLOT_NAME={}\n".format(slot_name),
+            "MODALIAS=pci:v0000{}d0000{}sv0000{}sd0000{}bc{}sc{}i{}\n".format(vendor_id.upper(), device_id.upper(), subsystem_vendor_id.upper(), subsystem_device_id.upper(), class_code[:2].upper(), class_code[2:4].upper(), class_code[4:].upper())
+        )))
+
+        bars = []
+        if kind == "gpu":
+            bars.append((0x6000000000, 0x67ffffffff, 0x14220c))
+            bars.append((0xf0000000, 0xf0ffffff, 0x40200))
+        elif kind != "bridge":
+            address = 0xa0000000 + self.counts.get("PCI Functions", 0) * 0x100000
+            bars.append((address, address + 0xfffff, 0x40200))
+        bars += [(0, 0, 0)] * (13 - len(bars))
+        self.write(function_dir + "/resource", "".join("0x{:016x} 0x{:016x} 0x{:016x}\n".format(*bar) for bar in bars))
+
+        for name in ("enable", "irq", "numa_node", "local_cpus", "msi_bus", "d3cold_allowed"):
+            self.write(function_dir + "/" + name, "0\n")
+        self.write(function_dir + "/power/control", "auto\n")
+
+        if not virtual_function:
+            acpi_node = self.add_acpi_node("\\_SB_.PC00.{}{:02X}".format(kind[:2].upper(), self.acpi_index % 0x100))
+            self.link(function_dir + "/firmware_node", acpi_node)
+
+        self.link("/sys/bus/pci/devices/" + slot_name, function_dir)
+        self.count("PCI Functions")
+        return function_dir
+
+    def add_gpu(self, index):
+        function_dir = self.add_pci_function("gpu")
+        card_dir = function_dir + "/drm/card{}".format(index)
+
+        self.link(card_dir + "/device", function_dir)
+        self.link("/sys/class/drm/card{}".format(index), card_dir)
+
+        for connector_index, connector_type in enumerate(("DP-1", "DP-2", "HDMI-A-1", "DP-3")):
+            connector_dir = card_dir + "/card{}-{}".format(index, connector_type)
+            connected = connector_index < 2
+
+            self.write(connector_dir + "/status", "connected\n" if connected else "disconnected\n")
+            self.write(connector_dir + "/enabled", "enabled\n" if connected else "disabled\n")
+            self.write(connector_dir + "/modes", "3840x2160\n2560x1440\n1920x1080\n" if connected else "")
+            self.write(connector_dir + "/edid", self.build_edid(0x4000 + index * 4 + connector_index) if connected else b"")
+            self.link("/sys/class/drm/card{}-{}".format(index, connector_type), connector_dir)
+
+            if connected:
+                self.count("Monitors")
+
+        for i2c_index in range(4):
+            self.write(function_dir + "/i2c-{}/name".format(index * 4 + i2c_index), "NVIDIA i2c adapter\n")
+
+        self.count("GPUs")
+
+    def build_edid(self, product_code):
+        manufacturer = "DEL"
+        manufacturer_id = sum((ord(character) - 64) << shift for character, shift in zip(manufacturer, (10, 5, 0)))
+
+        edid = bytearray(128)
+        edid[0:8] = b"\x00\xff\xff\xff\xff\xff\xff\x00"
+        edid[8:10] = struct.pack(">H", manufacturer_id)
+        edid[10:12] = struct.pack("<H", product_code)
+        edid[18:20] = b"\x01\x04"
+        edid[127] = (256 - sum(edid[:127]) % 256) % 256
+        return bytes(edid)
+
+    def add_hda(self, index):
+        function_dir = self.add_pci_function("hda")
+        card_dir = function_dir + "/sound/card{}".format(index)
+
+        self.link(card_dir + "/device", function_dir)
+        self.link("/sys/class/sound/card{}".format(index), card_dir)
+
+        for codec_index in range(2):
+            vendor_name, chip_name, vendor_id = HDA_CODECS[(index + codec_index) % len(HDA_CODECS)]
+            codec_dir = function_dir + "/hdaudioC{}D{}".format(index, codec_index)
+
+            self.write(codec_dir + "/vendor_name", vendor_name + "\n")
+            self.write(codec_dir + "/chip_name", chip_name + "\n")
+            self.write(codec_dir + "/vendor_id", vendor_id + "\n")
+            self.write(codec_dir + "/subsystem_id", "0x1028{:04x}\n".format(0x0a00 + index))
+            self.write(codec_dir + "/modalias", "hdaudio:v{}r00100002a01\n".format(vendor_id[2:].upper()))
+            self.count("HDA Codecs")
+
+        for pcm in ("pcm0p", "pcm0c", "pcm3p"):
+            self.write("/proc/asound/card{}/{}/info".format(index, pcm), "card: {}\ndevice: 0\nname: {} Analog\n".format(index, HDA_CODECS[index % len(HDA_CODECS)][1]))
+
+    def add_nvme(self, index):
+        function_dir = self.add_pci_function("nvme")
+        controller_dir = function_dir + "/nvme/nvme{}".format(index)
+
+        self.write(controller_dir + "/model", "Samsung SSD 990 PRO 2TB\n")
+        self.write(controller_dir + "/serial", "S6Z0NJ0W{:06d}\n".format(index))
+
+        namespace_dir = controller_dir + "/nvme{}n1".format(index)
+        for attribute in ("size", "ro", "removable", "range"):
+            self.write(namespace_dir + "/" + attribute, "0\n")
+        for attribute in ("nr_requests", "read_ahead_kb", "scheduler", "rotational", "max_sectors_kb", "logical_block_size", "physical_block_size", "discard_granularity", "write_cache", "nomerges"):
+            self.write(namespace_dir + "/queue/" + attribute, "0\n")
+        for partition in range(1, 4):
+            self.write(namespace_dir + "/nvme{}n1p{}/size".format(index, partition), "0\n")
+
+        self.count("NVMe Controllers")
+
+    def add_network(self, index, virtual_functions=0):
+        function_dir = self.add_pci_function("network")
+        self.add_net_interface("enp{}s0".format(index), function_dir)
+
+        if virtual_functions:
+            self.write(function_dir + "/sriov_numvfs", "{}\n".format(virtual_functions))
+            self.write(function_dir + "/sriov_totalvfs", "{}\n".format(virtual_functions))
+
+            bus_dir = os.path.dirname(function_dir)
+
+            for vf_index in range(virtual_functions):
+                vf_dir = self.add_pci_function("network", bus_dir=bus_dir if self.bus_slots.get(bus_dir, (0, 0, []))[2] else None, virtual_function=True)
+
+                self.link(function_dir + "/virtfn{}".format(vf_index), vf_dir)
+                self.link(vf_dir + "/physfn", function_dir)
+                self.add_net_interface("enp{}s0v{}".format(index, vf_index), vf_dir)
+                self.count("SR-IOV VFs")
+
+    def add_net_interface(self, name, function_dir):
+        interface_dir = function_dir + "/net/" + name
+
+        self.write(interface_dir + "/uevent", "INTERFACE={}\nIFINDEX={}\n".format(name, self.counts.get("Net Interfaces", 0) + 2))
+        self.write(interface_dir + "/address", "02:00:00:{:02x}:{:02x}:{:02x}\n".format(*self.random.randbytes(3)))
+        self.link(interface_dir + "/device", function_dir)
+        self.link("/sys/class/net/" + name, interface_dir)
+        self.count("Net Interfaces")
+
+    def add_usb_controller(self, index, device_count):
+        function_dir = self.add_pci_function("xhci")
+        bus_number = index + 1
+        hub_dir = function_dir + "/usb{}".format(bus_number)
+
+        self.write_usb_device(hub_dir, "1d6b", "0002", "Linux Foundation", "xHCI Host Controller", "09")
+        self.link("/sys/bus/usb/devices/usb{}".format(bus_number), hub_dir)
+
+        for port in range(1, device_count + 1):
+            vendor_id, product_id, manufacturer, product, device_class, interfaces = USB_PRODUCTS[(index + port) % len(USB_PRODUCTS)]
+            node = "{}-{}".format(bus_number, port)
+            device_dir = hub_dir + "/" + node
+
+            self.write_usb_device(device_dir, vendor_id, product_id, manufacturer, product, device_class)
+            self.link("/sys/bus/usb/devices/" + node, device_dir)
+
+            for interface_index, (interface_class, interface_subclass, interface_protocol, driver) in enumerate(interfaces):
+                interface = "{}:1.{}".format(node, interface_index)
+                interface_dir = device_dir + "/" + interface
+
+                self.write(interface_dir + "/bInterfaceClass", interface_class + "\n")
+                self.write(interface_dir + "/bInterfaceSubClass", interface_subclass + "\n")
+                self.write(interface_dir + "/bInterfaceProtocol", interface_protocol + "\n")
+                self.write(interface_dir + "/modalias", "usb:v{}p{}d0100dc{}dsc00dp00ic{}isc{}ip{}in{:02X}\n".format(vendor_id.upper(), product_id.upper(), device_class.upper(), interface_class.upper(), interface_subclass.upper(), interface_protocol.upper(), interface_index))
+                self.write(interface_dir + "/uevent", "DEVTYPE=usb_interface\nDRIVER={}\nPRODUCT={}/{}/100\nMODALIAS=usb:v{}p{}\n".format(driver, vendor_id.lstrip("0"), product_id.lstrip("0"), vendor_id.upper(), product_id.upper()))
+                os.makedirs(self.path("/sys/bus/usb/drivers/" + driver), exist_ok=True)
+                self.link(interface_dir + "/driver", "/sys/bus/usb/drivers/" + driver)
+                self.link("/sys/bus/usb/devices/" + interface, interface_dir)
+                self.count("USB Interfaces")
+
+                if driver == "btusb" and interface_index == 0:
+                    hci = "hci{}".format(self.counts.get("Bluetooth Controllers", 0))
+                    hci_dir = interface_dir + "/bluetooth/" + hci
+
+                    self.link(hci_dir + "/device", interface_dir)
+                    self.link("/sys/class/bluetooth/" + hci, hci_dir)
+                    self.count("Bluetooth Controllers")
+
+            self.count("USB Devices")
+
+    def write_usb_device(self, device_dir, vendor_id, product_id, manufacturer, product, device_class):
+        self.write(device_dir + "/idVendor", vendor_id + "\n")
+        self.write(device_dir + "/idProduct", product_id + "\n")
+        self.write(device_dir + "/bDeviceClass", device_class + "\n")
+        self.write(device_dir + "/bDeviceSubClass", ("01" if device_class == "e0" else "00") + "\n")
+        self.write(device_dir + "/bDeviceProtocol", ("01" if device_class == "e0" else "00") + "\n")
+        self.write(device_dir + "/speed", "480\n")
+
+        if manufacturer:
+            self.write(device_dir + "/manufacturer", manufacturer + "\n")
+        if product:
+            self.write(device_dir + "/product", product + "\n")
+
+    def add_input(self, index):
+        if index % 3 == 0:
+            bus_type, vendor_id, product_id, name = "0011", "0001", "0001", "AT Translated Set 2 keyboard"
+            capabilities = ("402000000 3803078f800d001 feffffdfffefffff fffffffffffffffe", "0", "0")
+        elif index % 3 == 1:
+            bus_type, vendor_id, product_id, name = "0003", "046d", "c52b", "Logitech USB Receiver Mouse"
+            capabilities = ("1f0000 0 0 0 0", "1943", "0")
+        else:
+            bus_type, vendor_id, product_id, name = "0018", "06cb", "ce7e", "SYNA7DB5:01 06CB:CE7E Touchpad"
+            capabilities = ("6420 0 10000 0 0 0 0", "0", "260800000000003")
+
+        input_dir = "/sys/devices/platform/i8042/serio{}/input/input{}".format(index // 3, index)
+
+        self.write(input_dir + "/name", name + "\n")
+        self.write(input_dir + "/id/bustype", bus_type + "\n")
+        self.write(input_dir + "/id/vendor", vendor_id + "\n")
+        self.write(input_dir + "/id/product", product_id + "\n")
+        self.write(input_dir + "/id/version", "0100\n")
+
+        for capability, value in zip(("key", "rel", "abs"), capabilities):
+            self.write(input_dir + "/capabilities/" + capability, value + "\n")
+
+        self.link("/sys/class/input/input{}".format(index), input_dir)
+        self.count("Input Nodes")
+
+    def add_platform_device(self, index):
+        hid = ("INT33D5", "PNP0C14", "INTC1055", "ACPI000C")[index % 4]
+        name = "{}:{:02d}".format(hid, index)
+        device_dir = "/sys/devices/platform/" + name
+
+        self.write(device_dir + "/modalias", "acpi:{}:\n".format(hid))
+        self.write(device_dir + "/driver_override", "(null)\n")
+        acpi_node = self.add_acpi_node("\\_SB_.DEV{:X}".format(index), hid=hid, description="Synthetic {} device".format(hid))
+        self.link(device_dir + "/firmware_node", acpi_node)
+        self.link("/sys/bus/platform/devices/" + name, device_dir)
+        self.count("Platform Devices")